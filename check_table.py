@@ -1,11 +1,10 @@
-import boto3
+from database import MentionDatabase
 
 
 def check_table_status():
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table("mentions")
-    print(f"Table Status: {table.table_status}")
-    return table.table_status
+    status = MentionDatabase(table_name="mentions").table_status()
+    print(f"Table Status: {status}")
+    return status
 
 
 if __name__ == "__main__":
@@ -1,24 +1,442 @@
+import asyncio
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
+import aioboto3
 import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from cachetools import TTLCache
+
+try:
+    from amazondax import AmazonDaxClient
+except ImportError:  # DAX is optional, only needed when DAX_ENDPOINT is set
+    AmazonDaxClient = None
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB BatchWriteItem limit
+BATCH_SIZE = 25
+
+# Mentions expire 30 days after they are written
+MENTION_TTL_SECONDS = 30 * 86400
+
+# Longest a buffered store_mention waits to be coalesced into a batch
+DEFAULT_MAX_WAIT_MS = 100
+
+# Time ranges wider than this are queried as parallel sub-ranges
+PARALLEL_QUERY_MIN_RANGE = 86400
+PARALLEL_QUERY_SEGMENTS = 8
+
+# In-process read caches, used when no DAX endpoint is configured; entries
+# expire so writes from other processes show up
+CACHE_MAX_SIZE = 4096
+CACHE_TTL_SECONDS = 60
+QUERY_CACHE_MAX_SIZE = 1024
+QUERY_CACHE_TTL_SECONDS = 30
+
+# Retries for items DynamoDB returns as UnprocessedItems
+MAX_BATCH_ATTEMPTS = 10
+
+MAX_POOL_CONNECTIONS = 50
+
+# Concurrent BatchWriteItem calls; must not exceed MAX_POOL_CONNECTIONS
+DEFAULT_PARALLELISM = 16
+
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+_deserializer = TypeDeserializer()
+
+_shared_session: Optional[boto3.session.Session] = None
+_shared_dynamodb: Any = None
+_shared_client: Any = None
+_shared_dax_clients: Dict[str, Any] = {}
+
+# Tables this process created after a write found them missing
+_verified_tables: Set[str] = set()
+_verified_tables_lock = threading.Lock()
+
+
+def _get_session() -> boto3.session.Session:
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = boto3.session.Session()
+    return _shared_session
+
+
+def get_dynamodb_resource() -> Any:
+    """
+    Returns the process-wide DynamoDB resource, creating it on first use.
+
+    Every MentionDatabase shares its session and HTTP connection pool, so
+    TLS connections are reused across instances.
+    """
+    global _shared_dynamodb
+    if _shared_dynamodb is None:
+        _shared_dynamodb = _get_session().resource("dynamodb", config=DYNAMODB_CONFIG)
+    return _shared_dynamodb
+
+
+def get_dynamodb_client() -> Any:
+    """
+    Returns the process-wide low-level DynamoDB client, creating it on first use.
+
+    Unlike ``resource.meta.client`` it takes items already in wire format.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = _get_session().client("dynamodb", config=DYNAMODB_CONFIG)
+    return _shared_client
+
+
+def get_dax_client(endpoint: str) -> Any:
+    """
+    Returns the process-wide DAX client for an endpoint, creating it on first use.
+
+    It takes the same wire-format requests as the DynamoDB client.
+    """
+    if AmazonDaxClient is None:
+        raise ImportError("DAX_ENDPOINT is set but amazondax is not installed")
+    if endpoint not in _shared_dax_clients:
+        _shared_dax_clients[endpoint] = AmazonDaxClient(
+            session=_get_session(), endpoint_url=endpoint
+        )
+    return _shared_dax_clients[endpoint]
+
 
 class MentionDatabase:
-    def __init__(self, table_name: str = os.environ.get("DYNAMODB_TABLE", "mentions")) -> None:
-        self.dynamodb = boto3.resource("dynamodb")
+    def __init__(
+        self,
+        table_name: str = os.environ.get("DYNAMODB_TABLE", "mentions"),
+        max_pool_connections: int = MAX_POOL_CONNECTIONS,
+        parallelism: int = DEFAULT_PARALLELISM,
+        dax_endpoint: Optional[str] = os.environ.get("DAX_ENDPOINT"),
+        buffer_writes: bool = False,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        self.dynamodb = get_dynamodb_resource()
         self.table_name = table_name
         self.table = self.dynamodb.Table(table_name)
+        self.max_pool_connections = max_pool_connections
+        self.parallelism = min(parallelism, max_pool_connections)
+
+        # DAX caches reads itself; without it results are cached in-process
+        if dax_endpoint:
+            self.client = get_dax_client(dax_endpoint)
+        else:
+            self.client = get_dynamodb_client()
+        self.local_cache = not dax_endpoint
+
+        # Results of get_mention / query_mentions_by_source, dropped on writes
+        self._cache_lock = threading.Lock()
+        self._mention_cache: TTLCache = TTLCache(
+            maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS
+        )
+        self._query_cache: TTLCache = TTLCache(
+            maxsize=QUERY_CACHE_MAX_SIZE, ttl=QUERY_CACHE_TTL_SECONDS
+        )
+
+        # Async client is opened once via ``async with MentionDatabase()``
+        self._async_stack: Optional[AsyncExitStack] = None
+        self._async_client: Any = None
+
+        # With buffer_writes, store_mention queues mentions for a background
+        # thread that writes them as BatchWriteItem calls
+        self.buffer_writes = buffer_writes
+        self.max_wait_ms = max_wait_ms
+        self._write_queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        if buffer_writes:
+            self._writer = threading.Thread(target=self._flush_loop, daemon=True)
+            self._writer.start()
+
+    async def __aenter__(self) -> "MentionDatabase":
+        """
+        Opens a long-lived aioboto3 DynamoDB client for the async methods.
+
+        It uses the sync client's timeouts and retries, with a connection
+        pool sized for ``max_pool_connections`` concurrent batches.
+        """
+        config = DYNAMODB_CONFIG.merge(
+            Config(max_pool_connections=self.max_pool_connections)
+        )
+        self._async_stack = AsyncExitStack()
+        self._async_client = await self._async_stack.enter_async_context(
+            aioboto3.Session().client("dynamodb", config=config)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._async_stack is not None:
+            await self._async_stack.aclose()
+        self._async_stack = None
+        self._async_client = None
+
+    def _require_async_client(self) -> Any:
+        if self._async_client is None:
+            raise RuntimeError(
+                "Async methods require 'async with MentionDatabase() as db'"
+            )
+        return self._async_client
+
+    def clear_cache(self) -> None:
+        """
+        Drops all cached get_mention and query_mentions_by_source results.
+        """
+        with self._cache_lock:
+            self._mention_cache.clear()
+            self._query_cache.clear()
+
+    def _cache_get(self, cache: TTLCache, key: Any) -> Any:
+        if not self.local_cache:
+            return None
+        with self._cache_lock:
+            return cache.get(key)
+
+    def _cache_set(self, cache: TTLCache, key: Any, value: Any) -> None:
+        if self.local_cache:
+            with self._cache_lock:
+                cache[key] = value
+
+    def _invalidate(self, keys: List[Tuple[str, int]]) -> None:
+        """
+        Drops cached results that a write to the given keys may have changed.
+        """
+        with self._cache_lock:
+            for key in keys:
+                self._mention_cache.pop(key, None)
+            self._query_cache.clear()
+
+    @staticmethod
+    def _expiry_ttl() -> int:
+        """TTL epoch for mentions written now; computed once per write call"""
+        return int(time.time()) + MENTION_TTL_SECONDS
+
+    @staticmethod
+    def _string_attr(value: Optional[str]) -> Dict[str, Any]:
+        """Wire-format string attribute; None is stored as NULL"""
+        return {"NULL": True} if value is None else {"S": value}
+
+    @classmethod
+    def _to_item(cls, mention: Dict[str, Any], ttl: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Builds the DynamoDB wire-format item for a mention with the given TTL.
+
+        Marshalling by hand skips boto3's per-item TypeSerializer pass.
+
+        Raises:
+            TypeError: If sentiment is neither a string, a number nor None
+        """
+        sentiment = mention.get("sentiment", "neutral")
+        # Some importers send numeric sentiment scores
+        if sentiment is None or isinstance(sentiment, str):
+            sentiment_attr = cls._string_attr(sentiment)
+        elif isinstance(sentiment, (int, float, Decimal)) and not isinstance(
+            sentiment, bool
+        ):
+            sentiment_attr = {"N": str(sentiment)}
+        else:
+            raise TypeError(f"Invalid sentiment: {sentiment!r}")
+        return {
+            "mention_id": {"S": mention["mention_id"]},
+            "timestamp": {"N": str(int(mention["timestamp"]))},
+            "source": {"S": mention["source"]},
+            "content": cls._string_attr(mention["content"]),
+            "url": cls._string_attr(mention.get("url", "")),
+            "author": cls._string_attr(mention.get("author", "")),
+            "sentiment": sentiment_attr,
+            "ttl": {"N": str(ttl)},
+        }
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff in seconds before the given retry attempt"""
+        return float(min(2**attempt * 0.05, 1.0))
+
+    def _log_unprocessed(self, unprocessed_items: Dict[str, Any], attempt: int) -> None:
+        count = len(unprocessed_items.get(self.table_name, []))
+        logger.warning(
+            f"{count} items throttled in batch write, retry {attempt} "
+            f"of {MAX_BATCH_ATTEMPTS - 1}"
+        )
+
+    @staticmethod
+    def _dedupe(mentions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keeps the last mention per (mention_id, timestamp) key.
+
+        BatchWriteItem rejects a request that writes the same key twice.
+        """
+        latest: Dict[Any, Dict[str, Any]] = {}
+        for index, mention in enumerate(mentions):
+            try:
+                key: Any = (mention["mention_id"], int(mention["timestamp"]))
+            except (KeyError, TypeError, ValueError):
+                # Left in place for _prepare_chunk to report as failed
+                key = index
+            latest[key] = mention
+        return list(latest.values())
+
+    @staticmethod
+    def _item_key(item: Dict[str, Dict[str, Any]]) -> Tuple[str, int]:
+        return item["mention_id"]["S"], int(item["timestamp"]["N"])
+
+    def _prepare_chunk(
+        self, chunk: List[Dict[str, Any]], ttl: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Builds the PutRequests for a chunk of mentions.
+
+        Returns:
+            tuple: (put_requests, prepared_mentions, failed_mentions)
+        """
+        put_requests = []
+        prepared = []
+        failed = []
+        for mention in chunk:
+            try:
+                item = self._to_item(mention, ttl)
+                put_requests.append({"PutRequest": {"Item": item}})
+                prepared.append(mention)
+            except Exception as e:
+                logger.error(f"Error in batch write: {str(e)}")
+                failed.append(mention)
+        return put_requests, prepared, failed
+
+    def _split_unprocessed(
+        self, prepared: List[Dict[str, Any]], unprocessed_items: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Splits prepared mentions by whether DynamoDB left them unprocessed.
+
+        Returns:
+            tuple: (successful_items, failed_items)
+        """
+        unprocessed = {
+            self._item_key(request["PutRequest"]["Item"])
+            for request in unprocessed_items.get(self.table_name, [])
+        }
+        if not unprocessed:
+            return prepared, []
+
+        successful_items = []
+        failed_items = []
+        for mention in prepared:
+            key = (mention["mention_id"], int(mention["timestamp"]))
+            if key in unprocessed:
+                failed_items.append(mention)
+            else:
+                successful_items.append(mention)
+        return successful_items, failed_items
+
+    @staticmethod
+    def _from_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Converts a wire-format item to plain Python values.
+
+        Numbers become int (or float) directly, skipping boto3's Decimal path.
+        Other types (NULL, BOOL, L, M, sets, ...) go through TypeDeserializer.
+        """
+        mention: Dict[str, Any] = {}
+        for name, value in item.items():
+            if "N" in value:
+                number = value["N"]
+                is_int = number.lstrip("-").isdigit()
+                mention[name] = int(number) if is_int else float(number)
+            elif "S" in value:
+                mention[name] = value["S"]
+            else:
+                mention[name] = _deserializer.deserialize(value)
+        return mention
+
+    @staticmethod
+    def _key(mention_id: str, timestamp: int) -> Dict[str, Dict[str, str]]:
+        return {
+            "mention_id": {"S": mention_id},
+            "timestamp": {"N": str(int(timestamp))},
+        }
+
+    @staticmethod
+    def _source_query_args(
+        source: str,
+        start_time: Optional[int],
+        end_time: Optional[int],
+        projection: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds the Query arguments for the source-timestamp-index, optionally
+        fetching only the ``projection`` attributes.
+        """
+        condition = "#source = :source"
+        values = {":source": {"S": source}}
+        if start_time and end_time:
+            condition += " AND #timestamp BETWEEN :start AND :end"
+            values[":start"] = {"N": str(int(start_time))}
+            values[":end"] = {"N": str(int(end_time))}
+        elif start_time:
+            condition += " AND #timestamp >= :start"
+            values[":start"] = {"N": str(int(start_time))}
+        elif end_time:
+            condition += " AND #timestamp <= :end"
+            values[":end"] = {"N": str(int(end_time))}
+
+        # Both attribute names are DynamoDB reserved words
+        names = {"#source": "source"}
+        if len(values) > 1:
+            names["#timestamp"] = "timestamp"
+        query_args: Dict[str, Any] = {
+            "IndexName": "source-timestamp-index",
+            "KeyConditionExpression": condition,
+            "ExpressionAttributeValues": values,
+        }
+        if projection:
+            placeholders = [f"#p{i}" for i in range(len(projection))]
+            names.update(zip(placeholders, projection))
+            query_args["ProjectionExpression"] = ", ".join(placeholders)
+        query_args["ExpressionAttributeNames"] = names
+        return query_args
+
+    def table_status(self) -> Optional[str]:
+        """
+        Returns the table's status from a single DescribeTable call, or None
+        if the table doesn't exist.
+        """
+        client = get_dynamodb_client()
+        try:
+            response = client.describe_table(TableName=self.table_name)
+        except client.exceptions.ResourceNotFoundException:
+            return None
+        status: str = response["Table"]["TableStatus"]
+        return status
 
     def create_table(self) -> None:
         """
         Creates the DynamoDB table for mentions if it doesn't exist.
         """
+        status = self.table_status()
+        if status is not None:
+            logger.info(f"Table {self.table_name} already exists")
+            if status == "CREATING":
+                self.table.meta.client.get_waiter("table_exists").wait(
+                    TableName=self.table_name,
+                    WaiterConfig={"Delay": 2, "MaxAttempts": 60},
+                )
+            return self.table
+
         try:
             table = self.dynamodb.create_table(
                 TableName=self.table_name,
@@ -44,8 +462,11 @@ class MentionDatabase:
                 BillingMode="PAY_PER_REQUEST",
             )
 
-            # Wait for the table to be created
-            table.meta.client.get_waiter("table_exists").wait(TableName=self.table_name)
+            # Wait for the table to be created, polling every 2s
+            table.meta.client.get_waiter("table_exists").wait(
+                TableName=self.table_name,
+                WaiterConfig={"Delay": 2, "MaxAttempts": 60},
+            )
 
             # Enable TTL
             table.meta.client.update_time_to_live(
@@ -59,87 +480,299 @@ class MentionDatabase:
             logger.info(f"Table {self.table_name} already exists")
             return self.table
 
+    def _create_missing_table(self, error: ClientError) -> bool:
+        """
+        Creates the table after a write failed because it doesn't exist.
+
+        Writes assume the table exists, so the happy path never pays for a
+        DescribeTable call.
+
+        Returns:
+            bool: True if the failed write should be retried once
+        """
+        if error.response["Error"]["Code"] != "ResourceNotFoundException":
+            return False
+        with _verified_tables_lock:
+            if self.table_name not in _verified_tables:
+                logger.info(f"Table {self.table_name} not found, creating it")
+                self.create_table()
+                _verified_tables.add(self.table_name)
+        return True
+
+    def _put_item(self, item: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.client.put_item(TableName=self.table_name, Item=item)
+        except ClientError as e:
+            if not self._create_missing_table(e):
+                raise
+            self.client.put_item(TableName=self.table_name, Item=item)
+
+    def _batch_write_item(self, request_items: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            response: Dict[str, Any] = self.client.batch_write_item(
+                RequestItems=request_items
+            )
+        except ClientError as e:
+            if not self._create_missing_table(e):
+                raise
+            response = self.client.batch_write_item(RequestItems=request_items)
+        return response
+
     def store_mention(self, mention: Dict[str, Any]) -> bool:
         """
         Stores a mention in the database.
 
+        With ``buffer_writes`` the mention is only queued; it is written with
+        up to 24 others within ``max_wait_ms``. Call flush() to wait for it.
+
         Args:
             mention (Dict): Mention data including required fields:
                           mention_id, source, content, timestamp
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful (or queued), False otherwise
         """
+        if self._writer is not None:
+            self._write_queue.put(mention)
+            return True
+
         try:
-            # Add TTL for mentions (30 days from now)
-            ttl = int((datetime.now() + timedelta(days=30)).timestamp())
-
-            item = {
-                "mention_id": mention["mention_id"],
-                "timestamp": int(mention["timestamp"]),
-                "source": mention["source"],
-                "content": mention["content"],
-                "url": mention.get("url", ""),
-                "author": mention.get("author", ""),
-                "sentiment": mention.get("sentiment", "neutral"),
-                "ttl": ttl,
-            }
-
-            self.table.put_item(Item=item)
+            item = self._to_item(mention, self._expiry_ttl())
+            self._put_item(item)
+            self._invalidate([self._item_key(item)])
             logger.info(f"Stored mention {mention['mention_id']}")
             return True
         except Exception as e:
             logger.error(f"Error storing mention: {str(e)}")
             return False
 
+    def flush(self) -> None:
+        """
+        Blocks until every buffered store_mention call has been written.
+        """
+        if self._writer is not None:
+            self._write_queue.join()
+
+    def close(self) -> None:
+        """
+        Flushes buffered writes and stops the background writer.
+        """
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _flush_loop(self) -> None:
+        """
+        Drains the write queue in batches of up to 25, waiting at most
+        ``max_wait_ms`` for a batch to fill. A None entry stops the loop.
+        """
+        stopping = False
+        while not stopping:
+            first = self._write_queue.get()
+            if first is None:
+                self._write_queue.task_done()
+                return
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            while len(batch) < BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    mention = self._write_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if mention is None:
+                    self._write_queue.task_done()
+                    stopping = True
+                    break
+                batch.append(mention)
+
+            try:
+                successful, failed = self._write_chunk(
+                    self._dedupe(batch), self._expiry_ttl()
+                )
+                self._invalidate(
+                    [(m["mention_id"], int(m["timestamp"])) for m in successful]
+                )
+                if failed:
+                    logger.error(f"Failed to store {len(failed)} buffered mentions")
+            except Exception as e:
+                logger.error(f"Error in buffered write: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
     def get_mention(self, mention_id: str, timestamp: int) -> Optional[Dict[str, Any]]:
         """
         Retrieves a specific mention by ID and timestamp.
+
+        Without DAX, found mentions are cached for CACHE_TTL_SECONDS. Each
+        call returns its own (shallow) copy, so callers may modify it.
         """
+        key = (mention_id, int(timestamp))
+        cached: Optional[Dict[str, Any]] = self._cache_get(self._mention_cache, key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            response = self.table.get_item(
-                Key={"mention_id": mention_id, "timestamp": timestamp}
+            response = self.client.get_item(
+                TableName=self.table_name, Key=self._key(mention_id, timestamp)
             )
-            return response.get("Item")
+            item = self._from_item(response["Item"]) if "Item" in response else None
         except Exception as e:
             logger.error(f"Error retrieving mention: {str(e)}")
             return None
 
+        if item is not None:
+            self._cache_set(self._mention_cache, key, dict(item))
+        return item
+
     def query_mentions_by_source(
         self,
         source: str,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         limit: int = 100,
+        projection: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Queries mentions by source with optional time range.
+
+        Pass ``projection`` to read only those attributes; every attribute
+        left out is bytes not transferred or billed.
+
+        Pages are followed until ``limit`` mentions are found. Time ranges
+        wider than PARALLEL_QUERY_MIN_RANGE are split into sub-ranges that
+        are queried concurrently. Results are in timestamp order and, without
+        DAX, cached for QUERY_CACHE_TTL_SECONDS per set of arguments; each
+        call returns its own list of (shallow) copies.
         """
+        cache_key = (
+            source,
+            start_time,
+            end_time,
+            limit,
+            tuple(projection) if projection else None,
+        )
+        cached: Optional[List[Dict[str, Any]]] = self._cache_get(
+            self._query_cache, cache_key
+        )
+        if cached is not None:
+            return [dict(item) for item in cached]
+
         try:
-            key_condition = Key("source").eq(source)
-            if start_time and end_time:
-                key_condition &= Key("timestamp").between(start_time, end_time)
-            elif start_time:
-                key_condition &= Key("timestamp").gte(start_time)
-            elif end_time:
-                key_condition &= Key("timestamp").lte(end_time)
-
-            response = self.table.query(
-                IndexName="source-timestamp-index",
-                KeyConditionExpression=key_condition,
-                Limit=limit,
-            )
-            return response.get("Items", [])
+            if (
+                start_time
+                and end_time
+                and end_time - start_time > PARALLEL_QUERY_MIN_RANGE
+            ):
+                items = self._query_segments(
+                    source, start_time, end_time, limit, projection
+                )
+            else:
+                items = self._query_pages(
+                    source, start_time, end_time, limit, projection
+                )
         except Exception as e:
             logger.error(f"Error querying mentions: {str(e)}")
             return []
 
+        self._cache_set(self._query_cache, cache_key, [dict(item) for item in items])
+        return items
+
+    def _query_pages(
+        self,
+        source: str,
+        start_time: Optional[int],
+        end_time: Optional[int],
+        limit: int,
+        projection: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Follows LastEvaluatedKey until ``limit`` items are read.
+        """
+        query_args = self._source_query_args(source, start_time, end_time, projection)
+        items, _ = self._read_pages(query_args, limit)
+        return items
+
+    def _read_pages(
+        self, query_args: Dict[str, Any], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Reads pages of a query until ``limit`` items are read.
+
+        Returns:
+            tuple: (items, last_key); last_key is None once the query is
+            exhausted, otherwise it resumes the query via ExclusiveStartKey
+        """
+        items: List[Dict[str, Any]] = []
+        last_key: Optional[Dict[str, Any]] = None
+        while len(items) < limit:
+            response = self.client.query(
+                TableName=self.table_name, Limit=limit - len(items), **query_args
+            )
+            items.extend(self._from_item(item) for item in response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if last_key is None:
+                break
+            query_args["ExclusiveStartKey"] = last_key
+        return items, last_key
+
+    def _query_segments(
+        self,
+        source: str,
+        start_time: int,
+        end_time: int,
+        limit: int,
+        projection: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Queries PARALLEL_QUERY_SEGMENTS contiguous sub-ranges concurrently.
+
+        Each sub-range first reads only its share of ``limit``. Sub-ranges
+        are then walked in order, and one that had more items is resumed
+        for just the items still missing, so at most about twice ``limit``
+        items are read instead of ``limit`` per sub-range.
+        """
+        step = (end_time - start_time + 1) // PARALLEL_QUERY_SEGMENTS + 1
+        segment_args = [
+            self._source_query_args(
+                source, lower, min(lower + step - 1, end_time), projection
+            )
+            for lower in range(start_time, end_time + 1, step)
+        ]
+        share = -(-limit // len(segment_args))
+        with ThreadPoolExecutor(max_workers=len(segment_args)) as executor:
+            futures = [
+                executor.submit(self._read_pages, query_args, share)
+                for query_args in segment_args
+            ]
+            segments = [future.result() for future in futures]
+
+        items: List[Dict[str, Any]] = []
+        for query_args, (segment, last_key) in zip(segment_args, segments):
+            items.extend(segment)
+            if last_key is not None and len(items) < limit:
+                # Later sub-ranges only count once this one is exhausted
+                more, _ = self._read_pages(query_args, limit - len(items))
+                items.extend(more)
+            if len(items) >= limit:
+                break
+        return items[:limit]
+
     def batch_store_mentions(
         self, mentions: List[Dict[str, Any]]
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Stores multiple mentions in batch.
 
+        Chunks of 25 are written concurrently on up to ``parallelism`` threads.
+        When several mentions share a key only the last one is written; the
+        earlier ones appear in neither returned list.
+
         Returns:
             tuple: (successful_items, failed_items)
         """
@@ -147,47 +780,204 @@ class MentionDatabase:
             successful_items = []
             failed_items = []
 
-            # Process in batches of 25 (DynamoDB limit)
-            batch_size = 25
-            for i in range(0, len(mentions), batch_size):
-                batch = mentions[i : i + batch_size]
-
-                # Prepare batch request
-                with self.table.batch_writer() as writer:
-                    for mention in batch:
-                        try:
-                            ttl = int((datetime.now() + timedelta(days=30)).timestamp())
-                            item = {
-                                "mention_id": mention["mention_id"],
-                                "timestamp": int(mention["timestamp"]),
-                                "source": mention["source"],
-                                "content": mention["content"],
-                                "url": mention.get("url", ""),
-                                "author": mention.get("author", ""),
-                                "sentiment": mention.get("sentiment", "neutral"),
-                                "ttl": ttl,
-                            }
-                            writer.put_item(Item=item)
-                            successful_items.append(mention)
-                        except Exception as e:
-                            logger.error(f"Error in batch write: {str(e)}")
-                            failed_items.append(mention)
+            mentions = self._dedupe(mentions)
 
+            chunks = [
+                mentions[i : i + BATCH_SIZE]
+                for i in range(0, len(mentions), BATCH_SIZE)
+            ]
+            ttl = self._expiry_ttl()
+            if len(chunks) <= 1:
+                results = [self._write_chunk(chunk, ttl) for chunk in chunks]
+            else:
+                workers = min(self.parallelism, len(chunks))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(self._write_chunk, chunk, ttl)
+                        for chunk in chunks
+                    ]
+                    results = [future.result() for future in futures]
+
+            for successful, failed in results:
+                successful_items.extend(successful)
+                failed_items.extend(failed)
+
+            self._invalidate(
+                [(m["mention_id"], int(m["timestamp"])) for m in successful_items]
+            )
             return successful_items, failed_items
         except Exception as e:
             logger.error(f"Error in batch store operation: {str(e)}")
             return [], mentions
 
+    def _write_chunk(
+        self, chunk: List[Dict[str, Any]], ttl: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Writes up to 25 mentions with BatchWriteItem, resending any
+        UnprocessedItems with exponential backoff.
+
+        Returns:
+            tuple: (successful_items, failed_items)
+        """
+        put_requests, prepared, failed_items = self._prepare_chunk(chunk, ttl)
+        if not put_requests:
+            return [], failed_items
+
+        # Only the items DynamoDB leaves unprocessed are resent on each retry
+        unprocessed_items: Dict[str, Any] = {self.table_name: put_requests}
+        try:
+            for attempt in range(MAX_BATCH_ATTEMPTS):
+                if attempt:
+                    self._log_unprocessed(unprocessed_items, attempt)
+                    time.sleep(self._backoff_delay(attempt))
+                response = self._batch_write_item(unprocessed_items)
+                unprocessed_items = response.get("UnprocessedItems", {})
+                if not unprocessed_items:
+                    break
+        except Exception as e:
+            logger.error(f"Error in batch write: {str(e)}")
+
+        successful_items, unprocessed = self._split_unprocessed(
+            prepared, unprocessed_items
+        )
+        return successful_items, failed_items + unprocessed
+
     def delete_mention(self, mention_id: str, timestamp: int) -> bool:
         """
         Deletes a specific mention from the database.
         """
         try:
-            self.table.delete_item(
-                Key={"mention_id": mention_id, "timestamp": timestamp}
+            # Through self.client so DAX sees the delete, like every write
+            self.client.delete_item(
+                TableName=self.table_name, Key=self._key(mention_id, timestamp)
             )
+            self._invalidate([(mention_id, int(timestamp))])
             logger.info(f"Deleted mention {mention_id}")
             return True
         except Exception as e:
             logger.error(f"Error deleting mention: {str(e)}")
             return False
+
+    async def store_mention_async(self, mention: Dict[str, Any]) -> bool:
+        """
+        Async variant of store_mention.
+        """
+        client = self._require_async_client()
+        try:
+            item = self._to_item(mention, self._expiry_ttl())
+            await client.put_item(TableName=self.table_name, Item=item)
+            self._invalidate([self._item_key(item)])
+            logger.info(f"Stored mention {mention['mention_id']}")
+            return True
+        except Exception as e:
+            logger.error(f"Error storing mention: {str(e)}")
+            return False
+
+    async def get_mention_async(
+        self, mention_id: str, timestamp: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of get_mention.
+        """
+        client = self._require_async_client()
+        try:
+            response = await client.get_item(
+                TableName=self.table_name, Key=self._key(mention_id, timestamp)
+            )
+            return self._from_item(response["Item"]) if "Item" in response else None
+        except Exception as e:
+            logger.error(f"Error retrieving mention: {str(e)}")
+            return None
+
+    async def query_mentions_by_source_async(
+        self,
+        source: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        projection: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of query_mentions_by_source.
+
+        Pages are followed until ``limit`` mentions are found; sub-ranges are
+        not queried in parallel and results are not cached.
+        """
+        client = self._require_async_client()
+        query_args = self._source_query_args(source, start_time, end_time, projection)
+        items: List[Dict[str, Any]] = []
+        try:
+            while len(items) < limit:
+                response = await client.query(
+                    TableName=self.table_name, Limit=limit - len(items), **query_args
+                )
+                items.extend(
+                    self._from_item(item) for item in response.get("Items", [])
+                )
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            return items
+        except Exception as e:
+            logger.error(f"Error querying mentions: {str(e)}")
+            return []
+
+    async def batch_store_mentions_async(
+        self, mentions: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Stores multiple mentions, writing batches of 25 concurrently.
+
+        At most ``max_pool_connections`` batches are in flight at once. As in
+        batch_store_mentions, only the last mention per key is written.
+
+        Returns:
+            tuple: (successful_items, failed_items)
+        """
+        client = self._require_async_client()
+        semaphore = asyncio.Semaphore(self.max_pool_connections)
+
+        async def write_chunk(
+            chunk: List[Dict[str, Any]]
+        ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            put_requests, prepared, failed_items = self._prepare_chunk(chunk, ttl)
+            if not put_requests:
+                return [], failed_items
+
+            unprocessed_items: Dict[str, Any] = {self.table_name: put_requests}
+            async with semaphore:
+                try:
+                    for attempt in range(MAX_BATCH_ATTEMPTS):
+                        if attempt:
+                            self._log_unprocessed(unprocessed_items, attempt)
+                            await asyncio.sleep(self._backoff_delay(attempt))
+                        response = await client.batch_write_item(
+                            RequestItems=unprocessed_items
+                        )
+                        unprocessed_items = response.get("UnprocessedItems", {})
+                        if not unprocessed_items:
+                            break
+                except Exception as e:
+                    logger.error(f"Error in batch write: {str(e)}")
+
+            successful_items, unprocessed = self._split_unprocessed(
+                prepared, unprocessed_items
+            )
+            return successful_items, failed_items + unprocessed
+
+        ttl = self._expiry_ttl()
+        mentions = self._dedupe(mentions)
+        chunks = [
+            mentions[i : i + BATCH_SIZE] for i in range(0, len(mentions), BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(write_chunk(chunk) for chunk in chunks))
+
+        successful: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+        for chunk_successful, chunk_failed in results:
+            successful.extend(chunk_successful)
+            failed.extend(chunk_failed)
+
+        self._invalidate([(m["mention_id"], int(m["timestamp"])) for m in successful])
+        return successful, failed
@@ -1,19 +1,46 @@
+import asyncio
 import json
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
 import requests
 from dotenv import load_dotenv
-from typing import Any, Dict, List, Optional
+from requests.adapters import HTTPAdapter
 
 from database import MentionDatabase
 
+logger = logging.getLogger(__name__)
+
+# Mentions requested per API call; larger limits are fetched as parallel pages
+PAGE_SIZE = 100
+MAX_PAGE_WORKERS = 20
+
+
+def create_session() -> requests.Session:
+    """Create a keep-alive session pooled for concurrent page fetches"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=MAX_PAGE_WORKERS,
+        pool_maxsize=MAX_PAGE_WORKERS,
+        max_retries=3,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = create_session()
+
 
 def get_session_token(api_key: str) -> Optional[str]:
     """Get a session token using the API key"""
     login_url = "https://app.mentionmind.com/api/login.php"
     
     print("Getting session token...")
-    response = requests.post(login_url, data={'key': api_key})
+    response = SESSION.post(login_url, data={'key': api_key})
     
     if not response.ok:
         print(f"Login failed with status code: {response.status_code}")
@@ -34,6 +61,10 @@ def get_session_token(api_key: str) -> Optional[str]:
         return None
 
 
+# ASCII unit separator, used to sanitize several fields in one codec pass
+FIELD_SEPARATOR = "\x1f"
+
+
 def sanitize_text(text: Optional[str]) -> str:
     if not text:
         return ""
@@ -47,6 +78,25 @@ def sanitize_text(text: Optional[str]) -> str:
         return "[Text contains invalid characters]"
 
 
+def sanitize_fields(*values: Any) -> List[str]:
+    """Sanitize several fields with a single encode/decode round-trip"""
+    texts = [str(value) if value else "" for value in values]
+    joined = FIELD_SEPARATOR.join(texts)
+    if joined.count(FIELD_SEPARATOR) != len(texts) - 1:
+        # A field contains the separator itself; sanitize one by one
+        return [sanitize_text(text) for text in texts]
+    sanitized = joined.encode('ascii', errors='replace').decode('ascii')
+    return sanitized.split(FIELD_SEPARATOR)
+
+
+def parse_timestamp(date_str: Optional[str]) -> int:
+    """Convert a 'YYYY-MM-DD HH:MM:SS' local time to epoch seconds (0 if empty)"""
+    if not date_str:
+        return 0
+    # fromisoformat is C-implemented and accepts the space separator
+    return int(datetime.fromisoformat(date_str).timestamp())
+
+
 def process_mention(mention: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     try:
         # Get ID directly from the raw mention
@@ -60,52 +110,53 @@ def process_mention(mention: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if mention.get('text_summary'):
             content = f"{content}\n{mention['text_summary']}"
             
-        # Clean the content - replace problematic characters
-        content = sanitize_text(content)
+        # Clean the text fields - replace problematic characters
+        content, source, url, author, title, keywords = sanitize_fields(
+            content,
+            mention.get('source', ''),
+            mention.get('url', ''),
+            mention.get('author', ''),
+            mention.get('title', ''),
+            mention.get('keywords', ''),
+        )
         
         sanitized_mention = {
             'mention_id': mention_id,
-            'timestamp': int(datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S').timestamp()) if date_str else 0,
-            'source': sanitize_text(mention.get('source', '')),
+            'timestamp': parse_timestamp(date_str),
+            'source': source,
             'content': content if content else '[No content available]',
-            'url': sanitize_text(mention.get('url', '')),
-            'author': sanitize_text(mention.get('author', '')),
+            'url': url,
+            'author': author,
             'sentiment': mention.get('sentiment', 0),
-            'title': sanitize_text(mention.get('title', '')),
-            'keywords': sanitize_text(mention.get('keywords', ''))
+            'title': title,
+            'keywords': keywords
         }
         
-        # Print formatted output
-        print("\n---")
-        print(f"ID: {mention_id}")
-        print(f"Date: {date_str}")
-        print(f"Source: {sanitized_mention['source']}")
-        print(f"Title: {sanitized_mention['title']}")
-        print(f"Keywords: {sanitized_mention['keywords']}")
-        print(f"Content: {content if content else '[No content available]'}")
-        print(f"URL: {sanitized_mention['url']}")
-        print("---")
+        logger.debug("mention %s from %s at %s", mention_id, source, date_str)
         
         return sanitized_mention
         
     except Exception as e:
-        print(f"Error processing mention {mention.get('id', 'unknown')}: {str(e)}")
+        logger.error("Error processing mention %s: %s", mention.get('id', 'unknown'), e)
         return None
 
 
-def get_mentions(token: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+def get_mentions_page(
+    token: str, limit: int, offset: int = 0
+) -> Optional[List[Dict[str, Any]]]:
     url = 'https://app.mentionmind.com/api/mention.php'
     params = {
         'token': token,
         'func': 'getMentions',
         'project_id': '1597',
         'limit': str(limit),
+        'offset': str(offset),
         'sort': 'date',
         'order': 'DESC'
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         print("\nAPI URL:", response.url)
         print("Using params:", params)
         print("\nResponse Status:", response.status_code)
@@ -114,8 +165,10 @@ def get_mentions(token: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
             # Parse JSON response
             mentions = response.json()
             if mentions:
-                print("\nFirst mention data (debug):")
-                print(json.dumps(mentions[0], indent=2))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "First mention data: %s", json.dumps(mentions[0], indent=2)
+                    )
                 print(f"\nFetched {len(mentions)} mentions")
                 return mentions
             else:
@@ -135,6 +188,36 @@ def get_mentions(token: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
         return None
 
 
+def get_mentions(token: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+    """Fetch up to limit mentions, requesting PAGE_SIZE pages concurrently"""
+    offsets = range(0, limit, PAGE_SIZE)
+    if len(offsets) <= 1:
+        return get_mentions_page(token, limit)
+
+    workers = min(MAX_PAGE_WORKERS, len(offsets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = list(executor.map(
+            lambda offset: get_mentions_page(
+                token, min(PAGE_SIZE, limit - offset), offset
+            ),
+            offsets,
+        ))
+    
+    mentions: List[Dict[str, Any]] = []
+    for page in pages:
+        if page is None:
+            return None
+        mentions.extend(page)
+    return mentions
+
+
+async def store_mentions(
+    mentions: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    async with MentionDatabase() as db:
+        return await db.batch_store_mentions_async(mentions)
+
+
 def import_real_mentions(limit: int = 10) -> None:
     # Load environment variables
     load_dotenv()
@@ -150,8 +233,6 @@ def import_real_mentions(limit: int = 10) -> None:
         print("Failed to get session token")
         return
     
-    db = MentionDatabase()
-    
     # Fetch mentions
     mentions = get_mentions(session_token, limit)
     if not mentions:
@@ -171,17 +252,13 @@ def import_real_mentions(limit: int = 10) -> None:
     
     # Store in DynamoDB
     print(f"\nStoring {len(dynamo_mentions)} mentions in DynamoDB...")
-    successful, failed = db.batch_store_mentions(dynamo_mentions)
+    successful, failed = asyncio.run(store_mentions(dynamo_mentions))
     
     print(f"\nSuccessfully stored: {len(successful)} mentions")
     if failed:
         print(f"Failed to store: {len(failed)} mentions")
-    
-    # Print out the stored mentions
-    print("\nStored Mentions:")
-    for mention in mentions:  # Use raw mentions for display
-        process_mention(mention)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
     import_real_mentions(10)
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from datetime import datetime, timedelta
 
@@ -27,12 +28,12 @@ def create_test_mentions(count=10):
     return mentions
 
 
-def main():
-    db = MentionDatabase()
+async def main():
     mentions = create_test_mentions(10)
 
     print("Importing 10 test mentions...")
-    successful, failed = db.batch_store_mentions(mentions)
+    async with MentionDatabase() as db:
+        successful, failed = await db.batch_store_mentions_async(mentions)
 
     print(f"Successfully imported: {len(successful)} mentions")
     if failed:
@@ -48,4 +49,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
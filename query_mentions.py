@@ -1,5 +1,4 @@
 from datetime import datetime
-from decimal import Decimal
 
 from database import MentionDatabase
 
@@ -8,13 +7,13 @@ def query_reddit_mentions():
     db = MentionDatabase()
 
     print("Querying Reddit mentions...")
-    mentions = db.query_mentions_by_source("reddit")
+    mentions = db.query_mentions_by_source(
+        "reddit", projection=["mention_id", "timestamp", "content", "url"]
+    )
 
     print(f"\nFound {len(mentions)} Reddit mentions:")
     for mention in mentions:
-        # Convert Decimal timestamp to readable date
-        timestamp = int(mention["timestamp"])
-        mention_date = datetime.fromtimestamp(timestamp)
+        mention_date = datetime.fromtimestamp(mention["timestamp"])
         print(f"\nID: {mention['mention_id']}")
         print(f"Date: {mention_date}")
         print(f"Content: {mention['content']}")
@@ -0,0 +1,280 @@
+"""
+Async MentionMind API client implementation
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, cast
+
+import httpx
+
+from ..utils.json_utils import loads
+from .client import MentionMindClient
+from .constants import (
+    DEFAULT_BASE_URL,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RATE_LIMIT_CALLS,
+    DEFAULT_RATE_LIMIT_PERIOD,
+    DEFAULT_TIMEOUT,
+    ENDPOINT_MENTIONS,
+)
+from .exceptions import APIError, ValidationError
+from .mention_processor import MentionProcessor
+from .token_manager import AsyncTokenManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """Rate limiter for coroutines sharing one event loop"""
+
+    def __init__(
+        self,
+        calls: int = DEFAULT_RATE_LIMIT_CALLS,
+        period: float = DEFAULT_RATE_LIMIT_PERIOD,
+    ):
+        self.calls = calls
+        self.period = period
+        self.timestamps: Deque[float] = deque(maxlen=calls)
+        self._lock = asyncio.Lock()
+
+    async def wait_if_needed(self) -> None:
+        """Wait if necessary to respect rate limits"""
+        async with self._lock:
+            now = time.time()
+            while self.timestamps and now - self.timestamps[0] > self.period:
+                self.timestamps.popleft()
+
+            if len(self.timestamps) >= self.calls:
+                sleep_time = self.timestamps[0] + self.period - now
+                if sleep_time > 0:
+                    await asyncio.sleep(sleep_time)
+                    now = time.time()
+
+            self.timestamps.append(now)
+
+
+class AsyncMentionMindClient:
+    """Async client for the MentionMind API over a shared HTTP/2 connection"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rate_limit_calls: int = DEFAULT_RATE_LIMIT_CALLS,
+        rate_limit_period: float = DEFAULT_RATE_LIMIT_PERIOD,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Initialize the async MentionMind API client
+
+        Args:
+            api_key: API key for authentication
+            base_url: Base URL for the API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed connections
+            rate_limit_calls: Number of calls allowed per period
+            rate_limit_period: Period for rate limiting in seconds
+            transport: Optional transport, replaces the default HTTP/2 one
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_connections=DEFAULT_MAX_CONNECTIONS,
+                    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            transport=transport,
+        )
+
+        # Initialize components
+        self.token_manager = AsyncTokenManager(self._client)
+        self.rate_limiter = AsyncRateLimiter(rate_limit_calls, rate_limit_period)
+        self.mention_processor = MentionProcessor()
+
+    async def __aenter__(self) -> "AsyncMentionMindClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections"""
+        await self._client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, str]] = None,
+        json: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an API request with rate limiting and error handling
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
+            json: JSON body data
+
+        Returns:
+            Dict[str, Any]: API response data
+
+        Raises:
+            APIError: If the API request fails
+        """
+        await self.rate_limiter.wait_if_needed()
+
+        headers = await self.token_manager.get_auth_headers(self.api_key)
+
+        try:
+            response = await self._client.request(
+                method=method,
+                url=endpoint.lstrip("/"),
+                headers=headers,
+                params=params,
+                json=json,
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"API request failed: {str(e)}")
+            raise APIError(f"API request failed: {str(e)}")
+
+        if not response.is_success:
+            try:
+                body = loads(response.content) if response.content else None
+            except ValueError:
+                # e.g. an HTML error page from a proxy
+                body = None
+            raise APIError(
+                f"API request failed: {response.text}",
+                status_code=response.status_code,
+                response=body,
+            )
+
+        # Return empty dict for successful empty responses (e.g., DELETE)
+        if not response.content:
+            return {}
+
+        try:
+            result = loads(response.content)
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {str(e)}")
+            raise APIError(
+                f"Invalid JSON response: {str(e)}", status_code=response.status_code
+            )
+        if not isinstance(result, dict):
+            return {"data": result}
+        return result
+
+    async def get_mentions(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 100,
+        process: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch mentions from the API
+
+        Args:
+            start_date: ISO format date string (YYYY-MM-DD)
+            end_date: ISO format date string (YYYY-MM-DD)
+            limit: Maximum number of mentions to return
+            process: Whether to process the mentions through the mention processor
+
+        Returns:
+            List[Dict[str, Any]]: List of mention objects
+
+        Raises:
+            ValidationError: If parameters are invalid
+            APIError: If the API request fails
+        """
+        if start_date and not MentionMindClient._is_valid_date(start_date):
+            raise ValidationError("start_date must be in YYYY-MM-DD format")
+        if end_date and not MentionMindClient._is_valid_date(end_date):
+            raise ValidationError("end_date must be in YYYY-MM-DD format")
+
+        params = {
+            "limit": str(limit),
+        }
+        if start_date:
+            params["startDate"] = start_date
+        if end_date:
+            params["endDate"] = end_date
+
+        response = await self._make_request("GET", ENDPOINT_MENTIONS, params=params)
+        mentions = cast(List[Dict[str, Any]], response.get("mentions", []))
+
+        if process:
+            return self.mention_processor.process_mentions(mentions)
+        return mentions
+
+    async def remove_mention(
+        self, mention_id: str, project_id: Optional[str] = None
+    ) -> bool:
+        """
+        Remove a mention by its ID
+
+        Args:
+            mention_id: ID of the mention to remove
+            project_id: Optional project ID
+
+        Returns:
+            bool: True if successful
+
+        Raises:
+            ValidationError: If mention_id is empty
+            APIError: If the API request fails
+        """
+        if not mention_id:
+            raise ValidationError("mention_id is required")
+
+        data = {"mention_id": mention_id}
+        if project_id:
+            data["project_id"] = project_id
+
+        await self._make_request(
+            method="POST", endpoint=f"{ENDPOINT_MENTIONS}/remove", json=data
+        )
+        return True
+
+    async def remove_all_mentions(self, project_id: str) -> bool:
+        """
+        Remove all mentions for a project
+
+        Args:
+            project_id: ID of the project
+
+        Returns:
+            bool: True if successful
+
+        Raises:
+            ValidationError: If project_id is empty
+            APIError: If the API request fails
+        """
+        if not project_id:
+            raise ValidationError("project_id is required")
+
+        await self._make_request(
+            method="POST",
+            endpoint=f"{ENDPOINT_MENTIONS}/remove_all",
+            json={"project_id": project_id},
+        )
+        return True
@@ -7,7 +7,9 @@ from typing import Dict, Optional
 
 import requests
 
+from .constants import TOKEN_REFRESH_BUFFER
 from .exceptions import AuthError
+from .token_manager import refresh_buffer
 
 
 class Auth:
@@ -23,8 +25,21 @@ class Auth:
         """
         self.client_id = client_id
         self.client_secret = client_secret
+        self._auth_header: Optional[Dict[str, str]] = None
         self.access_token: Optional[str] = None
         self.token_expiry: Optional[datetime] = None
+        self._refresh_buffer: float = TOKEN_REFRESH_BUFFER
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current access token"""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]) -> None:
+        # Build the header once per token rather than on every request
+        self._access_token = token
+        self._auth_header = {"Authorization": f"Bearer {token}"} if token else None
 
     def get_auth_header(self) -> Dict[str, str]:
         """
@@ -36,9 +51,9 @@ class Auth:
         Raises:
             AuthError: If no access token is available
         """
-        if not self.access_token:
+        if self._auth_header is None:
             raise AuthError("No access token available")
-        return {"Authorization": f"Bearer {self.access_token}"}
+        return self._auth_header
 
     def get_token(self) -> None:
         """
@@ -68,6 +83,7 @@ class Auth:
             self.access_token = data["access_token"]
             expires_in = data["expires_in"]
             self.token_expiry = datetime.now() + timedelta(seconds=expires_in)
+            self._refresh_buffer = refresh_buffer(expires_in)
 
         except requests.exceptions.RequestException as e:
             raise AuthError(f"Failed to get access token: {str(e)}")
@@ -85,11 +101,14 @@ class Auth:
 
     def refresh_token(self) -> None:
         """
-        Refresh the access token
+        Refresh the access token unless it is valid for longer than
+        TOKEN_REFRESH_BUFFER seconds, or half its lifetime if that is shorter
 
         Raises:
             AuthError: If token refresh fails
         """
-        if not self.is_token_expired():
+        if self.token_expiry and (
+            datetime.now() + timedelta(seconds=self._refresh_buffer) < self.token_expiry
+        ):
             return
         self.get_token()
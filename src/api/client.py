@@ -3,17 +3,21 @@ MentionMind API client implementation
 """
 
 import logging
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Deque, Dict, List, Optional, cast
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+from ..utils.json_utils import loads
 from .constants import (
     DEFAULT_BASE_URL,
     DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_SIZE,
     DEFAULT_RATE_LIMIT_CALLS,
     DEFAULT_RATE_LIMIT_PERIOD,
     DEFAULT_TIMEOUT,
@@ -33,22 +37,31 @@ class RateLimiter:
         self,
         calls: int = DEFAULT_RATE_LIMIT_CALLS,
         period: float = DEFAULT_RATE_LIMIT_PERIOD,
+        time_fn: Callable[[], float] = time.time,
+        sleep_fn: Callable[[float], None] = time.sleep,
     ):
         self.calls = calls
         self.period = period
-        self.timestamps: List[float] = []
+        self.timestamps: Deque[float] = deque(maxlen=calls)
+        self._lock = threading.Lock()
+        # Clock and sleep seams, replaceable in tests
+        self._time = time_fn
+        self._sleep = sleep_fn
 
     def wait_if_needed(self) -> None:
         """Wait if necessary to respect rate limits"""
-        now = time.time()
-        self.timestamps = [ts for ts in self.timestamps if now - ts <= self.period]
+        with self._lock:
+            now = self._time()
+            while self.timestamps and now - self.timestamps[0] > self.period:
+                self.timestamps.popleft()
 
-        if len(self.timestamps) >= self.calls:
-            sleep_time = self.timestamps[0] + self.period - now
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if len(self.timestamps) >= self.calls:
+                sleep_time = self.timestamps[0] + self.period - now
+                if sleep_time > 0:
+                    self._sleep(sleep_time)
+                    now = self._time()
 
-        self.timestamps.append(now)
+            self.timestamps.append(now)
 
 
 class MentionMindClient:
@@ -62,6 +75,7 @@ class MentionMindClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         rate_limit_calls: int = DEFAULT_RATE_LIMIT_CALLS,
         rate_limit_period: float = DEFAULT_RATE_LIMIT_PERIOD,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """
         Initialize the MentionMind API client
@@ -73,14 +87,27 @@ class MentionMindClient:
             max_retries: Maximum number of retries for failed requests
             rate_limit_calls: Number of calls allowed per period
             rate_limit_period: Period for rate limiting in seconds
+            session: Optional session, used as-is instead of the default pooled
+                session with retries
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries  # Store max_retries as instance variable
 
-        # Set up session with retry logic
-        self.session = requests.Session()
+        if session is None:
+            session = self._create_session(max_retries)
+        self.session = session
+
+        # Initialize components
+        self.token_manager = TokenManager(self.session, self.base_url)
+        self.rate_limiter = RateLimiter(rate_limit_calls, rate_limit_period)
+        self.mention_processor = MentionProcessor()  # Initialize MentionProcessor
+
+    @staticmethod
+    def _create_session(max_retries: int) -> requests.Session:
+        """Create a session with retry logic and a pooled keep-alive adapter"""
+        session = requests.Session()
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=0.5,
@@ -95,14 +122,15 @@ class MentionMindClient:
                 "POST",
             ],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-        # Initialize components
-        self.token_manager = TokenManager(self.session, self.base_url)
-        self.rate_limiter = RateLimiter(rate_limit_calls, rate_limit_period)
-        self.mention_processor = MentionProcessor()  # Initialize MentionProcessor
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_SIZE,
+            pool_maxsize=DEFAULT_POOL_SIZE,
+            max_retries=retry_strategy,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
 
     def _make_request(
         self,
@@ -145,14 +173,14 @@ class MentionMindClient:
                 raise APIError(
                     f"API request failed: {response.text}",
                     status_code=response.status_code,
-                    response=response.json() if response.text else None,
+                    response=loads(response.content) if response.content else None,
                 )
 
             # Return empty dict for successful empty responses (e.g., DELETE)
-            if not response.text:
+            if not response.content:
                 return {}
 
-            result = response.json()
+            result = loads(response.content)
             if not isinstance(result, dict):
                 return {"data": result}
             return result
@@ -166,6 +194,9 @@ class MentionMindClient:
                     response=e.response.json() if e.response.text else None,
                 )
             raise APIError(f"API request failed: {str(e)}")
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {str(e)}")
+            raise APIError(f"Invalid JSON response: {str(e)}")
 
     def get_mentions(
         self,
@@ -6,6 +6,12 @@ Constants for the MentionMind API client
 DEFAULT_BASE_URL = "https://app.mentionmind.com/api"
 DEFAULT_TIMEOUT = 30  # seconds
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_POOL_SIZE = 50  # pooled keep-alive connections per host
+DEFAULT_MAX_CONNECTIONS = 100  # async client
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50  # async client
+
+# Authentication
+TOKEN_REFRESH_BUFFER = 300  # seconds before expiry to refresh a token
 
 # Rate Limiting
 DEFAULT_RATE_LIMIT_CALLS = 100
@@ -3,11 +3,145 @@ Process mentions from CSV files into standardized format
 """
 
 import csv
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from itertools import count, islice
+from operator import itemgetter
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from .mention_processor import MentionProcessor
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pacsv = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Row = Tuple[Optional[str], ...]
+
+# Arrow parses the file in blocks of this many bytes
+CSV_BLOCK_SIZE = 8 << 20
+
+# Read buffer for the csv module fallback
+CSV_READ_BUFFER = 1 << 20
+
+# Number of processed mentions yielded at a time by the iter_* methods
+DEFAULT_CHUNK_SIZE = 10_000
+
+REDDIT_COLUMNS = (
+    "id",
+    "project_id",
+    "source",
+    "title",
+    "snippet",
+    "url",
+    "author",
+    "date_added",
+    "status",
+)
+TWITTER_COLUMNS = (
+    "ID",
+    "Title",
+    "Snippet",
+    "URL",
+    "Account Name",
+    "Date added",
+    "Status",
+)
+
+
+def _read_rows(csv_path: str, columns: Sequence[str]) -> Iterator[Row]:
+    """
+    Read the given columns from a CSV file as tuples of strings
+
+    Columns missing from the file come back as None. The file is parsed
+    block by block, so memory use does not grow with the file size.
+    """
+    # Arrow rejects a zero-byte file instead of reading no rows
+    if os.path.getsize(csv_path) == 0:
+        return
+
+    if pacsv is None:
+        yield from _read_rows_csv(csv_path, columns)
+        return
+
+    done = 0
+    try:
+        reader = pacsv.open_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in columns},
+                include_columns=list(columns),
+                include_missing_columns=True,
+            ),
+        )
+        for batch in reader:
+            yield from zip(*(column.to_pylist() for column in batch.columns))
+            done += batch.num_rows
+    except pa.ArrowInvalid as e:
+        # Arrow cannot pad ragged rows, so the csv module reads the rest
+        logger.warning("Reading %s with the csv module: %s", csv_path, e)
+        yield from islice(_read_rows_csv(csv_path, columns), done, None)
+
+
+def _read_rows_csv(csv_path: str, columns: Sequence[str]) -> Iterator[Row]:
+    """Read rows with the csv module, padding short rows with None"""
+    with open(
+        csv_path, "r", encoding="utf-8", buffering=CSV_READ_BUFFER, newline=""
+    ) as f:
+        reader = csv.reader(f, dialect="unix")
+        header = next(reader, [])
+        index = {name: i for i, name in enumerate(header)}
+        positions = [index.get(name) for name in columns]
+        # Rows holding every column take the itemgetter fast path
+        get = None if None in positions else itemgetter(*positions)
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if get is not None and len(row) >= width:
+                yield get(row)
+            else:
+                yield tuple(
+                    row[i] if i is not None and i < len(row) else None
+                    for i in positions
+                )
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality field so all rows share one string object"""
+    return sys.intern(value) if value is not None else None
+
+
+def _chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group items into lists of at most size elements"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _process_reddit_chunk(rows: List[Row]) -> List[Dict]:
+    """Process a chunk of Reddit rows in a worker process"""
+    return list(CSVProcessor()._process_reddit_rows(rows))
+
 
 class CSVProcessor:
     """Process mentions from CSV files"""
@@ -25,33 +159,88 @@ class CSVProcessor:
         Returns:
             List of processed mentions
         """
-        mentions = []
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Combine title and snippet for text
-                text = row["title"]
-                if row.get("snippet"):
-                    text = f"{text}\n{row['snippet']}"
-
-                mention = {
-                    "id": row["id"],
-                    "project_id": row["project_id"],
-                    "source": row["source"],
-                    "text": text,
-                    "url": row["url"],
-                    "author": row["author"],
-                    "date": row["date_added"],  # Already in ISO format
-                    "status": row["status"],
-                }
-
-                try:
-                    processed = self.mention_processor.process_mention(mention)
-                    mentions.append(processed)
-                except Exception as e:
-                    print(f"Error processing mention {mention['id']}: {str(e)}")
-
-        return mentions
+        return [m for chunk in self.iter_reddit_csv(csv_path) for m in chunk]
+
+    def iter_reddit_csv(
+        self, csv_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[Dict]]:
+        """
+        Stream a Reddit CSV file as chunks of standardized mentions
+
+        Args:
+            csv_path: Path to Reddit CSV file
+            chunk_size: Maximum number of mentions per chunk
+
+        Yields:
+            Lists of processed mentions
+        """
+        return _chunked(self._iter_reddit_mentions(csv_path), chunk_size)
+
+    def process_reddit_csv_parallel(
+        self,
+        csv_path: str,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[Dict]:
+        """
+        Process Reddit CSV file into standardized mentions across processes
+
+        The file is parsed in this process and chunks of rows are handed to
+        worker processes, since quoted fields can span lines and make it
+        unsafe to split the file by byte offset.
+
+        Args:
+            csv_path: Path to Reddit CSV file
+            workers: Number of worker processes, defaults to the CPU count
+            chunk_size: Number of rows sent to a worker at a time
+
+        Returns:
+            List of processed mentions, in file order
+        """
+        chunks = _chunked(_read_rows(csv_path, REDDIT_COLUMNS), chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_process_reddit_chunk, chunks)
+            return [m for chunk in results for m in chunk]
+
+    def _iter_reddit_mentions(self, csv_path: str) -> Iterator[Dict]:
+        """Yield processed mentions from a Reddit CSV file one at a time"""
+        return self._process_reddit_rows(_read_rows(csv_path, REDDIT_COLUMNS))
+
+    def _process_reddit_rows(self, rows: Iterable[Row]) -> Iterator[Dict]:
+        """Yield processed mentions from Reddit CSV rows"""
+        for (
+            mention_id,
+            project_id,
+            source,
+            title,
+            snippet,
+            url,
+            author,
+            date_added,
+            status,
+        ) in rows:
+            # Combine title and snippet for text
+            text = title
+            if snippet:
+                text = f"{text}\n{snippet}"
+
+            mention = {
+                "id": mention_id,
+                "project_id": _intern(project_id),
+                "source": _intern(source),
+                "text": text,
+                "url": url,
+                "author": author,
+                "date": date_added,  # Already in ISO format
+                "status": _intern(status),
+            }
+
+            try:
+                yield self.mention_processor.process_mention(
+                    mention, validate_date=False
+                )
+            except Exception as e:
+                logger.warning("Error processing mention %s: %s", mention["id"], e)
 
     def process_twitter_csv(self, csv_path: str) -> List[Dict]:
         """
@@ -63,31 +252,55 @@ class CSVProcessor:
         Returns:
             List of processed mentions
         """
-        mentions = []
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Combine title and snippet for text
-                text = row["Title"]
-                if row.get("Snippet"):
-                    text = f"{text}\n{row['Snippet']}"
-
-                mention = {
-                    "id": row.get(
-                        "ID", f"twitter_{datetime.now().timestamp()}"
-                    ),  # Generate ID if not present
-                    "source": "twitter",
-                    "text": text,
-                    "url": row["URL"],
-                    "author": row["Account Name"],
-                    "date": row["Date added"],  # Already in ISO format
-                    "status": row["Status"],
-                }
-
-                try:
-                    processed = self.mention_processor.process_mention(mention)
-                    mentions.append(processed)
-                except Exception as e:
-                    print(f"Error processing mention from {mention['url']}: {str(e)}")
-
-        return mentions
+        return [m for chunk in self.iter_twitter_csv(csv_path) for m in chunk]
+
+    def iter_twitter_csv(
+        self, csv_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[Dict]]:
+        """
+        Stream a Twitter CSV file as chunks of standardized mentions
+
+        Args:
+            csv_path: Path to Twitter CSV file
+            chunk_size: Maximum number of mentions per chunk
+
+        Yields:
+            Lists of processed mentions
+        """
+        return _chunked(self._iter_twitter_mentions(csv_path), chunk_size)
+
+    def _iter_twitter_mentions(self, csv_path: str) -> Iterator[Dict]:
+        """Yield processed mentions from a Twitter CSV file one at a time"""
+        # Rows without an ID get one from the file's start time plus a counter
+        base = int(datetime.now().timestamp())
+        counter = count()
+        for mention_id, title, snippet, url, author, date_added, status in _read_rows(
+            csv_path, TWITTER_COLUMNS
+        ):
+            # Combine title and snippet for text
+            text = title
+            if snippet:
+                text = f"{text}\n{snippet}"
+
+            mention = {
+                "id": (
+                    mention_id
+                    if mention_id is not None
+                    else f"twitter_{base}_{next(counter)}"
+                ),  # Generate ID if not present
+                "source": "twitter",
+                "text": text,
+                "url": url,
+                "author": author,
+                "date": date_added,  # Already in ISO format
+                "status": _intern(status),
+            }
+
+            try:
+                yield self.mention_processor.process_mention(
+                    mention, validate_date=False
+                )
+            except Exception as e:
+                logger.warning(
+                    "Error processing mention from %s: %s", mention["url"], e
+                )
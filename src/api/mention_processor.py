@@ -3,66 +3,184 @@ Process mentions to enrich with metadata
 """
 
 import re
-from datetime import datetime
-from typing import Dict, List
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 
-import pytz
-
 from .exceptions import ValidationError
 
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+# Hashtags and @mentions, matched in a single pass over the text. RE2's \w is
+# ASCII-only, so it gets explicit Unicode classes to match the same tags.
+if re2 is not None:  # pragma: no cover - optional dependency
+    _TAG_RE = re2.compile(r"#([\p{L}\p{N}_]+)|@([\p{L}\p{N}_]+)")
+else:
+    _TAG_RE = re.compile(r"#(\w+)|@(\w+)")
+
+# Runs of whitespace, collapsed to a single space by _clean_text
+_WS_RE = re.compile(r"\s+")
+
+# Dates that are always valid ISO 8601 timestamps. Days past the 28th are
+# left to fromisoformat, which knows how long each month is.
+_ISO_RE = re.compile(
+    r"(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?"
+)
+DATE_CACHE_SIZE = 1024
+
+# Mention streams repeat a lot of text (retweets, boilerplate), so
+# per-text analysis results are memoized up to this many entries
+ANALYSIS_CACHE_SIZE = 100_000
+
+
+# Kept at module level: lru_cache on a method would hold on to self
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _is_iso_date(date: str) -> bool:
+    """Check whether fromisoformat accepts the date"""
+    try:
+        datetime.fromisoformat(date.replace("Z", "+00:00"))
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _detect_language_cached(text: str) -> str:
+    """Detect language of text (placeholder)"""
+    return "unknown"
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analyze_sentiment_cached(text: str) -> str:
+    """Analyze sentiment of text (placeholder)"""
+    return "neutral"
+
 
 class MentionProcessor:
     """Process mentions to enrich with metadata"""
 
-    def __init__(self) -> None:
-        """Initialize the mention processor"""
-        # Common patterns we want to extract
-        self.hashtag_pattern = re.compile(r"#(\w+)")
-        self.mention_pattern = re.compile(r"@(\w+)")
-        self.url_pattern = re.compile(
-            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|"
-            r"(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-        )
+    REQUIRED = ("text", "source", "url", "author", "date", "status")
+
+    # Compiled once at import and shared by every instance
+    _tag_re = _TAG_RE
 
-    def process_mentions(self, mentions: List[Dict]) -> List[Dict]:
+    def process_mentions(
+        self, mentions: List[Dict], columnar: bool = False
+    ) -> List[Dict]:
         """
         Process a list of mentions to enrich with metadata
 
         Args:
             mentions: List of mentions to process
+            columnar: Use the pandas path (process_mentions_df) instead of
+                processing mention by mention
 
         Returns:
             List of processed mentions
+
+        Raises:
+            ImportError: If columnar is set and pandas is not installed
+        """
+        if columnar:
+            return self.process_mentions_df(mentions)
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+        return [self._process_mention_fast(mention, now_iso) for mention in mentions]
+
+    def process_mentions_df(self, mentions: List[Dict]) -> List[Dict]:
         """
-        return [self.process_mention(mention) for mention in mentions]
+        Process a list of mentions with pandas string operations
+
+        Text cleaning and tag extraction run column-wise over the whole batch;
+        URL and date checks stay per mention. Produces the same output as
+        process_mentions.
+
+        Args:
+            mentions: List of mentions to process
+
+        Returns:
+            List of processed mentions
 
-    def process_mention(self, mention: Dict) -> Dict:
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        if pd is None:
+            raise ImportError("pandas is required for process_mentions_df")
+
+        for mention in mentions:
+            for field in self.REQUIRED:
+                if field not in mention:
+                    raise ValidationError(f"Missing required field: {field}")
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+        texts = pd.Series([mention["text"] for mention in mentions], dtype=object)
+        texts = texts.str.replace(_WS_RE.pattern, " ", regex=True).str.strip()
+        hashtags = texts.str.findall(r"#(\w+)")
+        mentioned_users = texts.str.findall(r"@(\w+)")
+
+        for mention, text, tags, users in zip(
+            mentions, texts, hashtags, mentioned_users
+        ):
+            mention["text"] = text
+            mention["url"] = self._clean_url(mention["url"])
+            mention["date"] = self._validate_date(mention["date"])
+            mention["hashtags"] = tags
+            mention["mentioned_users"] = users
+            mention["search_text"] = self._generate_search_text(mention)
+            mention["processed_at"] = now_iso
+            mention["sentiment"] = self._analyze_sentiment(text)
+            mention["language"] = self._detect_language(text)
+
+        return mentions
+
+    def process_mention(self, mention: Dict, validate_date: bool = True) -> Dict:
         """
         Process a single mention to enrich with metadata
 
         Args:
             mention: Mention to process
+            validate_date: Whether to check the date is ISO formatted; sources
+                that are known to produce ISO dates can skip it
 
         Returns:
             Processed mention with metadata
         """
+        return self._process_mention_fast(
+            mention, datetime.now(timezone.utc).isoformat(), validate_date
+        )
+
+    def _process_mention_fast(
+        self, mention: Dict, now_iso: str, validate_date: bool = True
+    ) -> Dict:
+        """Process a mention using a processed_at timestamp computed by the caller"""
         # Validate required fields
-        required_fields = ["text", "source", "url", "author", "date", "status"]
-        for field in required_fields:
+        for field in self.REQUIRED:
             if field not in mention:
                 raise ValidationError(f"Missing required field: {field}")
 
         # Clean and validate fields
         mention["text"] = self._clean_text(mention["text"])
         mention["url"] = self._clean_url(mention["url"])
-        mention["date"] = self._validate_date(mention["date"])
+        if validate_date:
+            mention["date"] = self._validate_date(mention["date"])
 
         # Extract metadata
-        mention["hashtags"] = self._extract_hashtags(mention["text"])
-        mention["mentioned_users"] = self._extract_mentions(mention["text"])
+        mention["hashtags"], mention["mentioned_users"] = self._extract_tags(
+            mention["text"]
+        )
         mention["search_text"] = self._generate_search_text(mention)
-        mention["processed_at"] = datetime.now(pytz.UTC).isoformat()
+        mention["processed_at"] = now_iso
         mention["sentiment"] = self._analyze_sentiment(mention["text"])
         mention["language"] = self._detect_language(mention["text"])
 
@@ -70,45 +188,48 @@ class MentionProcessor:
 
     def _clean_text(self, text: str) -> str:
         """Clean text by removing extra whitespace"""
-        return " ".join(text.split())
+        return _WS_RE.sub(" ", text).strip()
 
     def _clean_url(self, url: str) -> str:
         """Clean and validate URL"""
-        if not self.url_pattern.match(url):
+        if not url.startswith(("http://", "https://")):
             raise ValidationError("Invalid URL format")
         parsed = urlparse(url)
+        if not parsed.netloc:
+            raise ValidationError("Invalid URL format")
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
     def _validate_date(self, date: str) -> str:
         """Validate date is in ISO format"""
-        try:
-            datetime.fromisoformat(date.replace("Z", "+00:00"))
+        if _ISO_RE.fullmatch(date) or _is_iso_date(date):
             return date
-        except ValueError:
-            raise ValidationError("Invalid date format")
-
-    def _extract_hashtags(self, text: str) -> List[str]:
-        """Extract hashtags from text"""
-        return self.hashtag_pattern.findall(text)
+        raise ValidationError("Invalid date format")
 
-    def _extract_mentions(self, text: str) -> List[str]:
-        """Extract @mentions from text"""
-        return self.mention_pattern.findall(text)
+    def _extract_tags(self, text: str) -> Tuple[List[str], List[str]]:
+        """Extract hashtags and @mentions from text"""
+        matches = self._tag_re.findall(text)
+        hashtags = [tag for tag, _ in matches if tag]
+        mentions = [user for _, user in matches if user]
+        return hashtags, mentions
 
     def _generate_search_text(self, mention: Dict) -> str:
         """Generate searchable text from mention"""
-        parts = [
-            mention["text"].lower(),
-            mention["author"].lower(),
-            " ".join(mention["hashtags"]),
-            " ".join(mention["mentioned_users"]),
-        ]
-        return " ".join(parts)
+        return (
+            f"{mention['text'].lower()} {mention['author'].lower()} "
+            f"{' '.join(mention['hashtags'])} {' '.join(mention['mentioned_users'])}"
+        )
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Clear the memoized date, language and sentiment results"""
+        _is_iso_date.cache_clear()
+        _detect_language_cached.cache_clear()
+        _analyze_sentiment_cached.cache_clear()
 
     def _detect_language(self, text: str) -> str:
-        """Detect language of text (placeholder)"""
-        return "unknown"
+        """Detect language of text"""
+        return _detect_language_cached(text)
 
     def _analyze_sentiment(self, text: str) -> str:
-        """Analyze sentiment of text (placeholder)"""
-        return "neutral"
+        """Analyze sentiment of text"""
+        return _analyze_sentiment_cached(text)
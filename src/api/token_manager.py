@@ -2,14 +2,29 @@
 Token management for the MentionMind API
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import asyncio
+import time
+from typing import Dict, Optional, cast
 
+import httpx
 import requests
 
+from ..utils.json_utils import loads
+from .constants import TOKEN_REFRESH_BUFFER
 from .exceptions import AuthError
 
 
+def refresh_buffer(expires_in: float) -> float:
+    """
+    Seconds before expiry at which a token is refreshed
+
+    Capped at half the token's lifetime, so a token that lives less than
+    TOKEN_REFRESH_BUFFER is still reused for a while instead of being
+    refreshed on every request.
+    """
+    return min(TOKEN_REFRESH_BUFFER, expires_in / 2)
+
+
 class TokenManager:
     """Manage authentication tokens for the MentionMind API"""
 
@@ -24,7 +39,11 @@ class TokenManager:
         self.session = session
         self.base_url = base_url
         self.token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
+        # time.monotonic() deadline, unaffected by wall-clock changes
+        self._expiry_mono = 0.0
+        self._refresh_buffer: float = TOKEN_REFRESH_BUFFER
+        # Rebuilt only when the token is refreshed
+        self._auth_headers: Optional[Dict[str, str]] = None
 
     def get_auth_headers(self, api_key: str) -> Dict[str, str]:
         """
@@ -36,12 +55,13 @@ class TokenManager:
         Returns:
             Dict containing authentication headers
         """
-        if not self.token or (
-            self.token_expiry and datetime.now() >= self.token_expiry
+        if (
+            self._auth_headers is None
+            or time.monotonic() + self._refresh_buffer >= self._expiry_mono
         ):
             self._refresh_token(api_key)
 
-        return {"Authorization": f"Bearer {self.token}"}
+        return cast(Dict[str, str], self._auth_headers)
 
     def _refresh_token(self, api_key: str) -> None:
         """
@@ -64,11 +84,80 @@ class TokenManager:
                     f"Failed to refresh token: {response.text}",
                 )
 
-            data = response.json()
+            data = loads(response.content)
             self.token = data["token"]
-            self.token_expiry = datetime.now() + timedelta(
-                seconds=data.get("expiresIn", 3600)
-            )
+            self._auth_headers = {"Authorization": f"Bearer {self.token}"}
+            expires_in = data.get("expiresIn", 3600)
+            self._expiry_mono = time.monotonic() + expires_in
+            self._refresh_buffer = refresh_buffer(expires_in)
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise AuthError(f"Failed to refresh token: {str(e)}")
+
+
+class AsyncTokenManager:
+    """Manage authentication tokens for the async MentionMind API client"""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        """
+        Initialize token manager
+
+        Args:
+            client: httpx client (with base_url set) to use for API calls
+        """
+        self.client = client
+        self.token: Optional[str] = None
+        # time.monotonic() deadline, unaffected by wall-clock changes
+        self._expiry_mono = 0.0
+        self._refresh_buffer: float = TOKEN_REFRESH_BUFFER
+        # Rebuilt only when the token is refreshed
+        self._auth_headers: Optional[Dict[str, str]] = None
+        # Concurrent requests wait for one refresh instead of each starting one
+        self._lock = asyncio.Lock()
+
+    async def get_auth_headers(self, api_key: str) -> Dict[str, str]:
+        """
+        Get authentication headers for API requests
+
+        Args:
+            api_key: API key to use for authentication
+
+        Returns:
+            Dict containing authentication headers
+        """
+        async with self._lock:
+            if (
+                self._auth_headers is None
+                or time.monotonic() + self._refresh_buffer >= self._expiry_mono
+            ):
+                await self._refresh_token(api_key)
+
+        return cast(Dict[str, str], self._auth_headers)
+
+    async def _refresh_token(self, api_key: str) -> None:
+        """
+        Refresh the authentication token
+
+        Args:
+            api_key: API key to use for authentication
+
+        Raises:
+            AuthError: If token refresh fails
+        """
+        try:
+            response = await self.client.post("auth/token", json={"apiKey": api_key})
+
+            if not response.is_success:
+                raise AuthError(
+                    f"Failed to refresh token: {response.text}",
+                )
+
+            data = loads(response.content)
+            self.token = data["token"]
+            self._auth_headers = {"Authorization": f"Bearer {self.token}"}
+            expires_in = data.get("expiresIn", 3600)
+            self._expiry_mono = time.monotonic() + expires_in
+            self._refresh_buffer = refresh_buffer(expires_in)
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             raise AuthError(f"Failed to refresh token: {str(e)}")
@@ -12,7 +12,7 @@ def setup_logging() -> Logger:
     logger.setLevel(log_level)
 
     # Remove existing handlers
-    for handler in logger.handlers:
+    for handler in logger.handlers[:]:
         logger.removeHandler(handler)
 
     # Create JSON formatter
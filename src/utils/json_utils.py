@@ -0,0 +1,16 @@
+"""
+JSON helpers that use orjson when it is installed
+"""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Both parsers accept bytes, so callers can pass response bodies undecoded
+loads: Callable[[Union[bytes, str]], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
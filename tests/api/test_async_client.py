@@ -0,0 +1,170 @@
+"""
+Tests for the async MentionMind API client
+"""
+
+import asyncio
+import json
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from src.api.async_client import AsyncMentionMindClient
+from src.api.exceptions import APIError, ValidationError
+
+
+def _transport(
+    requests: List[httpx.Request], status: int = 200, expires_in: int = 3600
+) -> httpx.MockTransport:
+    """Mock transport answering auth and mention endpoints"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/auth/token"):
+            return httpx.Response(
+                200, json={"token": "test-token", "expiresIn": expires_in}
+            )
+        if status != 200:
+            return httpx.Response(status, json={"error": "Internal server error"})
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json={
+                    "mentions": [
+                        {
+                            "id": "mention1",
+                            "text": "Test mention",
+                            "source": "twitter",
+                            "url": "https://twitter.com/test/1",
+                            "author": "test_user",
+                            "date": "2024-01-01T00:00:00Z",
+                            "status": "new",
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"success": True})
+
+    return httpx.MockTransport(handler)
+
+
+def test_get_mentions_concurrent() -> None:
+    """Test concurrent mention fetches authenticate once"""
+    requests: List[httpx.Request] = []
+
+    async def run() -> List[list]:
+        async with AsyncMentionMindClient(
+            "test-api-key", transport=_transport(requests)
+        ) as client:
+            return await asyncio.gather(
+                *(client.get_mentions(limit=10, process=False) for _ in range(3))
+            )
+
+    results = asyncio.run(run())
+
+    assert [len(mentions) for mentions in results] == [1, 1, 1]
+    assert [r.url.path for r in requests].count("/api/auth/token") == 1
+    mention_request = requests[-1]
+    assert mention_request.url.path == "/api/mention.php"
+    assert mention_request.headers["Authorization"] == "Bearer test-token"
+    assert mention_request.url.params["limit"] == "10"
+
+
+def test_token_refreshed_near_expiry() -> None:
+    """Test the token is refreshed once it is within the refresh buffer"""
+    requests: List[httpx.Request] = []
+
+    async def run() -> None:
+        async with AsyncMentionMindClient(
+            "test-api-key", transport=_transport(requests)
+        ) as client:
+            await client.get_mentions(process=False)
+            await client.get_mentions(process=False)
+            client.token_manager._expiry_mono = time.monotonic() + 10
+            await client.get_mentions(process=False)
+
+    asyncio.run(run())
+
+    assert [r.url.path for r in requests].count("/api/auth/token") == 2
+
+
+def test_short_lived_token_reused() -> None:
+    """Test a token living less than the refresh buffer is not refetched"""
+    requests: List[httpx.Request] = []
+
+    async def run() -> None:
+        async with AsyncMentionMindClient(
+            "test-api-key", transport=_transport(requests, expires_in=60)
+        ) as client:
+            await client.get_mentions(process=False)
+            await client.get_mentions(process=False)
+
+    asyncio.run(run())
+
+    assert [r.url.path for r in requests].count("/api/auth/token") == 1
+
+
+def test_remove_mention() -> None:
+    """Test mention removal request body"""
+    requests: List[httpx.Request] = []
+
+    async def run() -> bool:
+        async with AsyncMentionMindClient(
+            "test-api-key", transport=_transport(requests)
+        ) as client:
+            return await client.remove_mention("mention1", "project1")
+
+    assert asyncio.run(run()) is True
+    assert json.loads(requests[-1].content) == {
+        "mention_id": "mention1",
+        "project_id": "project1",
+    }
+
+
+def test_api_error_handling() -> None:
+    """Test handling of API errors"""
+
+    async def run() -> None:
+        async with AsyncMentionMindClient(
+            "test-api-key", transport=_transport([], status=500)
+        ) as client:
+            await client.get_mentions()
+
+    with pytest.raises(APIError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.response["error"] == "Internal server error"
+
+
+@pytest.mark.parametrize("status", [200, 502])
+def test_non_json_response(status: int) -> None:
+    """Test a non-JSON body raises APIError with the response status"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/auth/token"):
+            return httpx.Response(200, json={"token": "test-token", "expiresIn": 3600})
+        return httpx.Response(status, text="<html>Bad Gateway</html>")
+
+    async def run() -> None:
+        async with AsyncMentionMindClient(
+            "test-api-key", transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.get_mentions()
+
+    with pytest.raises(APIError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.status_code == status
+    assert exc_info.value.response is None
+
+
+def test_remove_all_mentions_invalid_id() -> None:
+    """Test validation of project ID"""
+
+    async def run() -> None:
+        async with AsyncMentionMindClient("test-api-key") as client:
+            await client.remove_all_mentions("")
+
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(run())
+    assert "project_id is required" in str(exc_info.value)
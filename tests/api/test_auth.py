@@ -2,6 +2,7 @@
 Tests for authentication functionality
 """
 
+from datetime import datetime, timedelta
 from typing import Dict
 
 import pytest
@@ -75,3 +76,41 @@ def test_get_token_server_error(auth: Auth) -> None:
         with pytest.raises(AuthError) as exc_info:
             auth.get_token()
         assert "Failed to get access token" in str(exc_info.value)
+
+
+TOKEN_URL = "https://api.mentionmind.com/oauth/token"
+
+
+@pytest.mark.parametrize("expires_in", [3600, 60], ids=["long_lived", "short_lived"])
+def test_refresh_token_skips_unexpired(auth: Auth, expires_in: int) -> None:
+    """Test refresh is skipped while the token is outside the refresh buffer"""
+    with requests_mock.Mocker() as m:
+        m.post(TOKEN_URL, json={"access_token": "test_token", "expires_in": expires_in})
+        auth.get_token()
+        auth.refresh_token()
+        assert m.call_count == 1
+    assert auth.get_auth_header()["Authorization"] == "Bearer test_token"
+
+
+@pytest.mark.parametrize(
+    "expires_in,remaining",
+    [(3600, 60), (60, 20)],
+    ids=["long_lived", "short_lived"],
+)
+def test_refresh_token_within_buffer(
+    auth: Auth, expires_in: int, remaining: int
+) -> None:
+    """Test refresh happens when the token is about to expire"""
+    with requests_mock.Mocker() as m:
+        m.post(
+            TOKEN_URL,
+            [
+                {"json": {"access_token": "old_token", "expires_in": expires_in}},
+                {"json": {"access_token": "new_token", "expires_in": expires_in}},
+            ],
+        )
+        auth.get_token()
+        auth.token_expiry = datetime.now() + timedelta(seconds=remaining)
+        auth.refresh_token()
+        assert m.call_count == 2
+    assert auth.get_auth_header()["Authorization"] == "Bearer new_token"
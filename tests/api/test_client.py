@@ -2,76 +2,129 @@
 Tests for the MentionMind API client
 """
 
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import Mock
+
 import pytest
+import requests
 import responses
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.api.client import MentionMindClient
+from src.api.client import MentionMindClient, RateLimiter
 from src.api.exceptions import APIError, ValidationError
 
 
-@pytest.fixture
-def client() -> MentionMindClient:
+BASE_URL = "https://app.mentionmind.com/api"
+# Requests to this base URL fail, for the error handling test
+FAILING_BASE_URL = "https://failing.mentionmind.com/api"
+
+
+# Endpoint mocks, registered per test with _mocks
+AUTH = {
+    "method": responses.POST,
+    "url": f"{BASE_URL}/auth/token",
+    "json": {"token": "test-token", "expiresIn": 3600},
+    "status": 200,
+}
+MENTIONS = {
+    "method": responses.GET,
+    "url": f"{BASE_URL}/mention.php",
+    "json": {
+        "mentions": [
+            {
+                "id": "mention1",
+                "text": "Test mention",
+                "source": "twitter",
+                "url": "https://twitter.com/test/1",
+                "author": "test_user",
+                "date": "2024-01-01T00:00:00Z",
+                "status": "new",
+            }
+        ],
+        "pagination": {"next_cursor": None},
+    },
+    "status": 200,
+}
+REMOVE = {
+    "method": responses.POST,
+    "url": f"{BASE_URL}/mention.php/remove",
+    "json": {"success": True},
+    "status": 200,
+}
+REMOVE_ALL = {
+    "method": responses.POST,
+    "url": f"{BASE_URL}/mention.php/remove_all",
+    "json": {"success": True},
+    "status": 200,
+}
+API_ERROR = {
+    "method": responses.GET,
+    "url": f"{FAILING_BASE_URL}/mention.php",
+    "json": {"error": "Internal server error"},
+    "status": 500,
+}
+
+
+@contextmanager
+def _mocks(*specs: Dict[str, Any]) -> Iterator[responses.RequestsMock]:
+    """Mock exactly the given endpoints; each must be called by the test"""
+    with responses.RequestsMock() as rsps:
+        for spec in specs:
+            rsps.add(**spec)
+        yield rsps
+
+
+# Shared by every test client so they all draw from one connection pool
+_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=20, max_retries=Retry(total=0))
+
+
+def _new_client(**kwargs: Any) -> MentionMindClient:
     """Create a test client with retries disabled"""
-    client = MentionMindClient("test-api-key")
     # Disable retries for testing
-    client.max_retries = 0
+    client = MentionMindClient("test-api-key", max_retries=0, **kwargs)
+    client.session.mount("https://", _ADAPTER)
+    client.session.mount("http://", _ADAPTER)
     return client
 
 
-@pytest.fixture
-def mock_auth() -> responses.RequestsMock:
-    """Mock successful authentication"""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        rsps.add(
-            responses.POST,
-            "https://api.mentionmind.com/oauth/token",
-            json={"access_token": "test-token", "expires_in": 3600},
-            status=200,
-        )
-        yield rsps
+def _authenticate(client: MentionMindClient) -> MentionMindClient:
+    """Give the client a valid cached token so it skips the auth request"""
+    client.token_manager.token = "test-token"
+    client.token_manager._auth_headers = {"Authorization": "Bearer test-token"}
+    client.token_manager._expiry_mono = time.monotonic() + 3600
+    return client
+
+
+def _mock_session(payload: Dict[str, Any], status: int = 200) -> Mock:
+    """Create a session whose requests all return the payload, skipping HTTP"""
+
+    def respond(method: str, url: str, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode()
+        response.url = url
+        return response
+
+    session = Mock(spec=requests.Session)
+    session.request.side_effect = respond
+    return session
 
 
 @pytest.fixture
-def mock_mentions() -> responses.RequestsMock:
-    """Mock successful mentions retrieval"""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        # Add auth mock
-        rsps.add(
-            responses.POST,
-            "https://api.mentionmind.com/oauth/token",
-            json={"access_token": "test-token", "expires_in": 3600},
-            status=200,
-        )
-
-        # Add mentions mock
-        rsps.add(
-            responses.GET,
-            "https://api.mentionmind.com/v1/mentions",
-            json={
-                "mentions": [
-                    {
-                        "id": "mention1",
-                        "text": "Test mention",
-                        "source": "twitter",
-                        "url": "https://twitter.com/test/1",
-                        "author": "test_user",
-                        "date": "2024-01-01T00:00:00Z",
-                        "status": "new",
-                    }
-                ],
-                "pagination": {"next_cursor": None},
-            },
-            status=200,
-        )
-        yield rsps
+def unauthenticated_client() -> MentionMindClient:
+    """Create a test client that still has to fetch a token"""
+    return _new_client()
 
 
-def test_get_mentions_success(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_mentions: responses.RequestsMock,
-) -> None:
+def test_get_mentions_success() -> None:
     """Test successful mentions retrieval with processing"""
+    session = _mock_session(MENTIONS["json"])
+    client = _authenticate(MentionMindClient("test-api-key", session=session))
+
     mentions = client.get_mentions(
         start_date="2024-01-01", end_date="2024-01-31", limit=10
     )
@@ -87,18 +140,20 @@ def test_get_mentions_success(
     assert mention["status"] == "new"
 
     # Check request parameters
-    request = mock_mentions.calls[-1].request
-    assert "start_date=2024-01-01" in request.url
-    assert "end_date=2024-01-31" in request.url
-    assert "limit=10" in request.url
+    request = session.request.call_args.kwargs
+    assert request["url"] == MENTIONS["url"]
+    assert request["params"] == {
+        "startDate": "2024-01-01",
+        "endDate": "2024-01-31",
+        "limit": "10",
+    }
 
 
-def test_get_mentions_without_processing(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_mentions: responses.RequestsMock,
-) -> None:
+def test_get_mentions_without_processing() -> None:
     """Test mentions retrieval without processing"""
+    session = _mock_session(MENTIONS["json"])
+    client = _authenticate(MentionMindClient("test-api-key", session=session))
+
     mentions = client.get_mentions(process=False)
 
     assert len(mentions) == 1
@@ -112,129 +167,71 @@ def test_get_mentions_without_processing(
     assert mention["status"] == "new"
 
 
-@pytest.fixture
-def mock_remove_mention(mock_auth: responses.RequestsMock) -> responses.RequestsMock:
-    """Mock successful mention removal"""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        # Add auth mock
-        rsps.add(
-            responses.POST,
-            "https://api.mentionmind.com/oauth/token",
-            json={"access_token": "test-token", "expires_in": 3600},
-            status=200,
-        )
-
-        # Add remove mention mock
-        rsps.add(
-            responses.DELETE,
-            "https://api.mentionmind.com/v1/mentions",
-            json={"success": True},
-            status=200,
-        )
-        yield rsps
-
-
-def test_remove_mention_success(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_remove_mention: responses.RequestsMock,
+@pytest.mark.parametrize(
+    "args,body",
+    [
+        (
+            ("mention1", "project1"),
+            b'{"mention_id": "mention1", "project_id": "project1"}',
+        ),
+        (("mention1",), b'{"mention_id": "mention1"}'),
+    ],
+    ids=["with_project", "without_project"],
+)
+def test_remove_mention(
+    authenticated_client: MentionMindClient, args: Tuple[str, ...], body: bytes
 ) -> None:
-    """Test successful mention removal"""
-    result = client.remove_mention("mention1", "project1")
+    """Test successful mention removal, with and without a project ID"""
+    with _mocks(REMOVE) as rsps:
+        result = authenticated_client.remove_mention(*args)
+        request = rsps.calls[-1].request
     assert result is True
 
     # Check request body
-    request = mock_remove_mention.calls[-1].request
-    assert request.body == b'{"mention_id": "mention1", "project_id": "project1"}'
+    assert request.body == body
 
 
-def test_remove_mention_without_project(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_remove_mention: responses.RequestsMock,
-) -> None:
-    """Test mention removal without project ID"""
-    result = client.remove_mention("mention1")
+def test_remove_all_mentions_success(authenticated_client: MentionMindClient) -> None:
+    """Test successful removal of all mentions"""
+    with _mocks(REMOVE_ALL) as rsps:
+        result = authenticated_client.remove_all_mentions("project1")
+        request = rsps.calls[-1].request
     assert result is True
 
     # Check request body
-    request = mock_remove_mention.calls[-1].request
-    assert request.body == b'{"mention_id": "mention1"}'
-
-
-@pytest.fixture
-def mock_remove_all_mentions(
-    mock_auth: responses.RequestsMock,
-) -> responses.RequestsMock:
-    """Mock successful removal of all mentions"""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        # Add auth mock
-        rsps.add(
-            responses.POST,
-            "https://api.mentionmind.com/oauth/token",
-            json={"access_token": "test-token", "expires_in": 3600},
-            status=200,
-        )
-
-        # Add remove all mentions mock
-        rsps.add(
-            responses.DELETE,
-            "https://api.mentionmind.com/v1/mentions/all",
-            json={"success": True},
-            status=200,
-        )
-        yield rsps
+    assert request.body == b'{"project_id": "project1"}'
 
 
-def test_remove_all_mentions_success(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_remove_all_mentions: responses.RequestsMock,
+# A token living less than the refresh buffer must still be reused
+@pytest.mark.parametrize("expires_in", [3600, 60], ids=["long_lived", "short_lived"])
+def test_auth_token_fetched_once(
+    unauthenticated_client: MentionMindClient, expires_in: int
 ) -> None:
-    """Test successful removal of all mentions"""
-    result = client.remove_all_mentions("project1")
-    assert result is True
+    """Test the client authenticates once and reuses the token"""
+    auth = dict(AUTH, json={"token": "test-token", "expiresIn": expires_in})
+    with _mocks(auth, MENTIONS) as rsps:
+        unauthenticated_client.get_mentions()
+        unauthenticated_client.get_mentions()
+        calls = list(rsps.calls)
 
-    # Check request body
-    request = mock_remove_all_mentions.calls[-1].request
-    assert request.body == b'{"project_id": "project1"}'
+    assert [call.request.method for call in calls] == ["POST", "GET", "GET"]
+    assert calls[-1].request.headers["Authorization"] == "Bearer test-token"
 
 
-def test_remove_all_mentions_invalid_id(client: MentionMindClient) -> None:
+def test_remove_all_mentions_invalid_id(
+    authenticated_client: MentionMindClient,
+) -> None:
     """Test validation of project ID"""
     with pytest.raises(ValidationError) as exc_info:
-        client.remove_all_mentions("")
+        authenticated_client.remove_all_mentions("")
     assert "project_id is required" in str(exc_info.value)
 
 
-@pytest.fixture
-def mock_api_error(mock_auth: responses.RequestsMock) -> responses.RequestsMock:
-    """Mock API error response"""
-    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
-        # Add auth mock
-        rsps.add(
-            responses.POST,
-            "https://api.mentionmind.com/oauth/token",
-            json={"access_token": "test-token", "expires_in": 3600},
-            status=200,
-        )
-
-        # Add error mock
-        rsps.add(
-            responses.GET,
-            "https://api.mentionmind.com/v1/mentions",
-            json={"error": "Internal server error"},
-            status=500,
-        )
-        yield rsps
-
-
-def test_api_error_handling(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_api_error: responses.RequestsMock,
-) -> None:
+def test_api_error_handling() -> None:
     """Test handling of API errors"""
+    session = _mock_session(API_ERROR["json"], status=500)
+    client = _authenticate(MentionMindClient("test-api-key", session=session))
+
     with pytest.raises(APIError) as exc_info:
         client.get_mentions()
 
@@ -242,19 +239,27 @@ def test_api_error_handling(
     assert exc_info.value.response["error"] == "Internal server error"
 
 
-def test_rate_limiting(
-    client: MentionMindClient,
-    mock_auth: responses.RequestsMock,
-    mock_mentions: responses.RequestsMock,
-) -> None:
+def test_rate_limiting() -> None:
     """Test rate limiting functionality"""
-    import time
+    client = _authenticate(
+        MentionMindClient("test-api-key", session=_mock_session(MENTIONS["json"]))
+    )
+
+    # A fake clock records throttling instead of waiting it out
+    clock = [1000.0]
+    sleeps: List[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    client.rate_limiter = RateLimiter(
+        calls=1, period=1.0, time_fn=lambda: clock[0], sleep_fn=fake_sleep
+    )
 
     # Make multiple requests
-    start_time = time.time()
     for _ in range(3):
         client.get_mentions()
-    end_time = time.time()
 
-    # Should take at least 2 seconds due to rate limiting
-    assert end_time - start_time >= 2
+    # One call per second means waiting a full period before each extra call
+    assert sum(sleeps) >= client.rate_limiter.period * 2
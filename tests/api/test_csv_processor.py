@@ -2,22 +2,75 @@
 Test CSV processing functionality
 """
 
-import os
+from typing import Dict, List
 
 import pytest
 
+from src.api import csv_processor
 from src.api.csv_processor import CSVProcessor
 
+# CSV parsing does no HTTP, so no responses mock is started for these tests
+pytestmark = pytest.mark.no_net
+
 
 @pytest.fixture
 def processor() -> CSVProcessor:
     return CSVProcessor()
 
 
-def test_process_reddit_csv(processor: CSVProcessor) -> None:
+# Seven Reddit rows whose snippets span two lines
+REDDIT_CSV = (
+    "id,project_id,source,title,snippet,url,author,date_added,status\n"
+    + "".join(
+        f'{i},1597,reddit,Title {i},"#tag{i}\nline two",'
+        f"https://reddit.com/r/test/{i},user{i},2024-01-01T00:00:00Z,new\n"
+        for i in range(7)
+    )
+).encode()
+
+
+# Three Twitter rows in the export's column layout, without an ID column
+TWITTER_CSV = (
+    "Title,Snippet,URL,Account Name,Date added,Status\n"
+    + "".join(
+        f"Tweet {i},#tag{i} @user{i},https://twitter.com/user{i}/status/{i},"
+        f"user{i},2024-01-01T00:00:00Z,new\n"
+        for i in range(3)
+    )
+).encode()
+
+
+@pytest.fixture(scope="module")
+def reddit_csv(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write the generated Reddit CSV once for the module"""
+    csv_path = tmp_path_factory.mktemp("csv") / "reddit.csv"
+    csv_path.write_bytes(REDDIT_CSV)
+    return str(csv_path)
+
+
+@pytest.fixture(scope="module")
+def twitter_csv(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write the generated Twitter CSV once for the module"""
+    csv_path = tmp_path_factory.mktemp("csv") / "twitter.csv"
+    csv_path.write_bytes(TWITTER_CSV)
+    return str(csv_path)
+
+
+@pytest.fixture(scope="module")
+def reddit_mentions(reddit_csv: str) -> List[Dict]:
+    """Process the generated Reddit CSV once for the module"""
+    return CSVProcessor().process_reddit_csv(reddit_csv)
+
+
+@pytest.fixture(scope="module")
+def twitter_mentions(twitter_csv: str) -> List[Dict]:
+    """Process the generated Twitter CSV once for the module"""
+    return CSVProcessor().process_twitter_csv(twitter_csv)
+
+
+def test_process_reddit_csv(reddit_mentions: List[Dict]) -> None:
     """Test processing Reddit CSV file"""
-    csv_path = os.path.join("tests", "MentionMind-Twitter - Reddit.csv")
-    mentions = processor.process_reddit_csv(csv_path)
+    mentions = reddit_mentions
 
     assert len(mentions) > 0
 
@@ -38,10 +91,9 @@ def test_process_reddit_csv(processor: CSVProcessor) -> None:
     assert mention["sentiment"] == "neutral"
 
 
-def test_process_twitter_csv(processor: CSVProcessor) -> None:
+def test_process_twitter_csv(twitter_mentions: List[Dict]) -> None:
     """Test processing Twitter CSV file"""
-    csv_path = os.path.join("tests", "MentionMind-Twitter - Twitter.csv")
-    mentions = processor.process_twitter_csv(csv_path)
+    mentions = twitter_mentions
 
     assert len(mentions) > 0
 
@@ -60,3 +112,128 @@ def test_process_twitter_csv(processor: CSVProcessor) -> None:
     assert "processed_at" in mention
     assert mention["language"] == "unknown"
     assert mention["sentiment"] == "neutral"
+
+
+def test_iter_reddit_csv_yields_chunks(
+    processor: CSVProcessor, reddit_csv: str
+) -> None:
+    """Test streaming a Reddit CSV file in fixed-size chunks"""
+    chunks = list(processor.iter_reddit_csv(reddit_csv, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2, 1]
+    assert [m["id"] for chunk in chunks for m in chunk] == [str(i) for i in range(7)]
+    assert chunks[0][0]["text"] == "Title 0 #tag0 line two"
+
+
+def test_twitter_csv_generates_unique_ids(twitter_mentions: List[Dict]) -> None:
+    """Test rows without an ID column get distinct generated IDs"""
+    ids = [m["id"] for m in twitter_mentions]
+
+    assert len(set(ids)) == 3
+    assert all(i.startswith("twitter_") for i in ids)
+    assert [i.rsplit("_", 1)[1] for i in ids] == ["0", "1", "2"]
+
+
+def test_process_reddit_csv_parallel_matches_serial(
+    processor: CSVProcessor, reddit_csv: str
+) -> None:
+    """Test parallel processing returns the serial results in file order"""
+    serial = processor.process_reddit_csv(reddit_csv)
+    parallel = processor.process_reddit_csv_parallel(
+        reddit_csv, workers=2, chunk_size=3
+    )
+
+    for mention in serial + parallel:
+        mention.pop("processed_at")
+    assert parallel == serial
+
+
+@pytest.mark.parametrize("arrow", [True, False], ids=["arrow", "csv"])
+def test_empty_csv_file(
+    processor: CSVProcessor, monkeypatch, tmp_path, arrow: bool
+) -> None:
+    """Test a zero-byte file yields no mentions"""
+    csv_path = tmp_path / "empty.csv"
+    csv_path.write_bytes(b"")
+    if not arrow:
+        monkeypatch.setattr(csv_processor, "pacsv", None)
+
+    assert processor.process_reddit_csv(str(csv_path)) == []
+    assert processor.process_twitter_csv(str(csv_path)) == []
+
+
+@pytest.mark.parametrize("block_size", [1 << 20, 64], ids=["one_block", "blocks"])
+def test_read_rows_arrow_ragged_rows(
+    monkeypatch, tmp_path, block_size: int
+) -> None:
+    """Test Arrow hands ragged files to the csv module without losing rows"""
+    csv_path = tmp_path / "twitter.csv"
+    csv_path.write_text(
+        "Title,Snippet,URL,Account Name,Date added,Status\n"
+        + "".join(f"Tweet {i},s,u,a,d,new\n" for i in range(20))
+        + "Short,x,y\n"
+        + "Long,a,b,c,d,e,extra\n"
+        + "Last,s,u,a,d,new\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(csv_processor, "CSV_BLOCK_SIZE", block_size)
+
+    rows = list(csv_processor._read_rows(str(csv_path), csv_processor.TWITTER_COLUMNS))
+
+    monkeypatch.setattr(csv_processor, "pacsv", None)
+    expected = list(
+        csv_processor._read_rows(str(csv_path), csv_processor.TWITTER_COLUMNS)
+    )
+    assert rows == expected
+    assert [row[1] for row in rows] == [f"Tweet {i}" for i in range(20)] + [
+        "Short",
+        "Long",
+        "Last",
+    ]
+    assert rows[20] == (None, "Short", "x", "y", None, None, None)
+
+
+def test_newline_only_csv_file(processor: CSVProcessor, tmp_path) -> None:
+    """Test a file holding only newlines yields no mentions"""
+    csv_path = tmp_path / "blank.csv"
+    csv_path.write_text("\n\n", encoding="utf-8")
+
+    assert processor.process_twitter_csv(str(csv_path)) == []
+
+
+def test_read_rows_csv_fallback(monkeypatch, tmp_path) -> None:
+    """Test the csv module fallback used when pyarrow is not installed"""
+    csv_path = tmp_path / "twitter.csv"
+    csv_path.write_text(
+        "Title,Snippet,URL,Account Name,Date added,Status\n"
+        'Tweet,"multi\nline",https://twitter.com/a/1,acct,2024-01-01T00:00:00Z,new\n'
+        "\n"
+        "Short,,https://twitter.com/a/2\n"
+        "Long,,https://twitter.com/a/3,acct,2024-01-01T00:00:00Z,new,extra\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(csv_processor, "pacsv", None)
+
+    rows = list(csv_processor._read_rows(str(csv_path), csv_processor.TWITTER_COLUMNS))
+
+    assert rows == [
+        (
+            None,
+            "Tweet",
+            "multi\nline",
+            "https://twitter.com/a/1",
+            "acct",
+            "2024-01-01T00:00:00Z",
+            "new",
+        ),
+        (None, "Short", "", "https://twitter.com/a/2", None, None, None),
+        (
+            None,
+            "Long",
+            "",
+            "https://twitter.com/a/3",
+            "acct",
+            "2024-01-01T00:00:00Z",
+            "new",
+        ),
+    ]
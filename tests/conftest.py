@@ -1,13 +1,46 @@
 import os
-import sys
-from pathlib import Path
-from typing import Dict, Generator
+import socket
+import time
+from typing import Any, Dict, Generator
 
 import pytest
 
-# Add the src directory to the Python path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path.absolute()))
+from src.api.client import MentionMindClient
+
+# MonkeyPatch holding the socket patches of a running no_net test
+_NO_NET_PATCH = pytest.StashKey[pytest.MonkeyPatch]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the markers used by this suite"""
+    # HTTP mocks such as responses are started inside the tests that need
+    # them; keep them out of autouse fixtures so no_net tests never pay
+    # for transport interception
+    config.addinivalue_line(
+        "markers", "no_net: test must not open network connections"
+    )
+
+
+def _refuse_connection(*args: Any, **kwargs: Any) -> None:
+    raise RuntimeError(f"no_net test tried to connect to {args[1:]!r}")
+
+
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Make sockets refuse to connect while a no_net test runs"""
+    # A hook rather than an autouse fixture, so unmarked tests set up nothing
+    if item.get_closest_marker("no_net") is None:
+        return
+    patch = pytest.MonkeyPatch()
+    patch.setattr(socket.socket, "connect", _refuse_connection)
+    patch.setattr(socket.socket, "connect_ex", _refuse_connection)
+    item.stash[_NO_NET_PATCH] = patch
+
+
+def pytest_runtest_teardown(item: pytest.Item) -> None:
+    """Restore sockets after a no_net test"""
+    patch = item.stash.get(_NO_NET_PATCH, None)
+    if patch is not None:
+        patch.undo()
 
 
 @pytest.fixture(scope="session")
@@ -18,9 +51,12 @@ def test_config() -> Dict[str, str]:
     }
 
 
-@pytest.fixture(autouse=True)
-def setup_test_environment() -> Generator[None, None, None]:
-    """Setup any necessary test environment variables or configurations"""
-    # Add any test environment setup here
-    yield
-    # Add any cleanup code here
+@pytest.fixture(scope="session")
+def authenticated_client() -> Generator[MentionMindClient, None, None]:
+    """Client holding a valid cached token, shared by every test module"""
+    client = MentionMindClient("test-api-key", max_retries=0)
+    client.token_manager.token = "test-token"
+    client.token_manager._auth_headers = {"Authorization": "Bearer test-token"}
+    client.token_manager._expiry_mono = time.monotonic() + 86400
+    yield client
+    client.session.close()
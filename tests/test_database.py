@@ -1,27 +1,80 @@
+import asyncio
 import os
-from datetime import datetime
+import time
+import uuid
 
 import boto3
 import pytest
 from moto import mock_dynamodb
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.dynamodb.models import dynamodb_backends
 
 from database import MentionDatabase
 
+# pytest-xdist sets this in each worker; a plain run is the "master" process
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "master")
+TABLE_NAME = f"test_mentions_{WORKER_ID}"
 
-@pytest.fixture
+# Every mention id is unique, so one timestamp serves the whole module
+_NOW = int(time.time())
+
+
+@pytest.fixture(scope="module")
 def dynamodb_table():
+    # Patch botocore once and create one table for the whole module
     with mock_dynamodb():
         # Create mock DynamoDB resource
-        db = MentionDatabase(table_name="test_mentions")
+        db = MentionDatabase(table_name=TABLE_NAME)
         db.create_table()
         yield db
 
 
+@pytest.fixture(autouse=True)
+def _clean_table(dynamodb_table):
+    yield
+    # Empty the table inside moto's backend, skipping a scan and batch delete
+    backend = dynamodb_backends[DEFAULT_ACCOUNT_ID][
+        dynamodb_table.client.meta.region_name
+    ]
+    backend.get_table(TABLE_NAME).items.clear()
+    dynamodb_table.clear_cache()
+
+
+def _unique(prefix):
+    """Make an id unique to this test run"""
+    return f"{prefix}_{uuid.uuid4().hex}"
+
+
+def test_create_table_when_exists(dynamodb_table):
+    assert dynamodb_table.table_status() == "ACTIVE"
+    table = dynamodb_table.create_table()
+    assert table.name == TABLE_NAME
+
+    missing = MentionDatabase(table_name="missing_mentions")
+    assert missing.table_status() is None
+
+
+def test_writes_create_missing_table(dynamodb_table, monkeypatch):
+    monkeypatch.setattr("database._verified_tables", set())
+    db = MentionDatabase(table_name="lazy_mentions")
+    mention = {
+        "mention_id": _unique("lazy_id"),
+        "timestamp": _NOW,
+        "source": "reddit",
+        "content": "Stored before the table existed",
+    }
+
+    assert db.table_status() is None
+    assert db.store_mention(mention) == True
+    assert db.table_status() == "ACTIVE"
+    assert db.get_mention(mention["mention_id"], mention["timestamp"]) is not None
+
+
 def test_store_and_retrieve_mention(dynamodb_table):
     # Test data
     mention = {
-        "mention_id": "test_id_1",
-        "timestamp": int(datetime.now().timestamp()),
+        "mention_id": _unique("test_id"),
+        "timestamp": _NOW,
         "source": "reddit",
         "content": "Test mention content",
         "url": "https://reddit.com/test",
@@ -39,12 +92,203 @@ def test_store_and_retrieve_mention(dynamodb_table):
     assert retrieved["content"] == mention["content"]
 
 
+def test_get_mention_reads_null_and_nested_values(dynamodb_table):
+    mention_id = _unique("null_id")
+    dynamodb_table.client.put_item(
+        TableName=TABLE_NAME,
+        Item={
+            "mention_id": {"S": mention_id},
+            "timestamp": {"N": str(_NOW)},
+            "source": {"S": "reddit"},
+            "author": {"NULL": True},
+            "tags": {"L": [{"S": "a"}, {"N": "1"}]},
+            "flags": {"SS": ["x", "y"]},
+        },
+    )
+
+    retrieved = dynamodb_table.get_mention(mention_id, _NOW)
+    assert retrieved["author"] is None
+    assert retrieved["tags"] == ["a", 1]
+    assert retrieved["flags"] == {"x", "y"}
+
+
+def test_get_mention_is_cached(dynamodb_table, monkeypatch):
+    mention = {
+        "mention_id": _unique("cached_id"),
+        "timestamp": _NOW,
+        "source": "reddit",
+        "content": "Cached content",
+    }
+    dynamodb_table.store_mention(mention)
+
+    calls = []
+    real_get_item = dynamodb_table.client.get_item
+
+    def counting_get_item(**kwargs):
+        calls.append(kwargs)
+        return real_get_item(**kwargs)
+
+    monkeypatch.setattr(dynamodb_table.client, "get_item", counting_get_item)
+
+    first = dynamodb_table.get_mention(mention["mention_id"], mention["timestamp"])
+    second = dynamodb_table.get_mention(mention["mention_id"], mention["timestamp"])
+    assert first == second
+    assert len(calls) == 1
+
+    # Writes to the same key invalidate the cached item
+    dynamodb_table.store_mention({**mention, "content": "Updated content"})
+    updated = dynamodb_table.get_mention(mention["mention_id"], mention["timestamp"])
+    assert updated["content"] == "Updated content"
+    assert len(calls) == 2
+
+
+def test_cached_results_are_copies(dynamodb_table):
+    mention = {
+        "mention_id": _unique("copy_id"),
+        "timestamp": _NOW,
+        "source": "reddit",
+        "content": "Original content",
+    }
+    dynamodb_table.store_mention(mention)
+
+    dynamodb_table.get_mention(mention["mention_id"], _NOW)["content"] = "Changed"
+    dynamodb_table.query_mentions_by_source("reddit")[0]["content"] = "Changed"
+
+    cached = dynamodb_table.get_mention(mention["mention_id"], _NOW)
+    assert cached["content"] == "Original content"
+    queried = dynamodb_table.query_mentions_by_source("reddit")
+    assert queried[0]["content"] == "Original content"
+
+
+def test_async_writes_invalidate_cache(dynamodb_table):
+    mention = {
+        "mention_id": _unique("async_id"),
+        "timestamp": _NOW,
+        "source": "reddit",
+        "content": "Old content",
+    }
+    dynamodb_table.store_mention(mention)
+    dynamodb_table.get_mention(mention["mention_id"], _NOW)
+    dynamodb_table.query_mentions_by_source("reddit")
+
+    # Writes from a stand-in async client land in the mocked table
+    class AsyncClient:
+        async def put_item(self, **kwargs):
+            return dynamodb_table.client.put_item(**kwargs)
+
+        async def batch_write_item(self, **kwargs):
+            return dynamodb_table.client.batch_write_item(**kwargs)
+
+    dynamodb_table._async_client = AsyncClient()
+    try:
+        updated = {**mention, "content": "Async content"}
+        assert asyncio.run(dynamodb_table.store_mention_async(updated))
+        assert (
+            dynamodb_table.get_mention(mention["mention_id"], _NOW)["content"]
+            == "Async content"
+        )
+
+        dynamodb_table.query_mentions_by_source("reddit")
+        batched = {**mention, "content": "Batched content"}
+        asyncio.run(dynamodb_table.batch_store_mentions_async([batched]))
+        queried = dynamodb_table.query_mentions_by_source("reddit")
+        assert [m["content"] for m in queried] == ["Batched content"]
+    finally:
+        dynamodb_table._async_client = None
+
+
+def test_async_client_uses_shared_config(dynamodb_table):
+    async def open_client():
+        async with MentionDatabase(
+            table_name=TABLE_NAME, max_pool_connections=32
+        ) as db:
+            return db._async_client.meta.config
+
+    config = asyncio.run(open_client())
+    assert config.max_pool_connections == 32
+    assert config.retries["mode"] == "adaptive"
+
+
+def test_dax_endpoint_replaces_client_and_local_cache(monkeypatch):
+    created = []
+
+    class FakeDaxClient:
+        def __init__(self, session, endpoint_url):
+            created.append(endpoint_url)
+
+    monkeypatch.setattr("database.AmazonDaxClient", FakeDaxClient)
+    monkeypatch.setattr("database._shared_dax_clients", {})
+
+    db = MentionDatabase(table_name=TABLE_NAME, dax_endpoint="dax://cluster")
+    assert isinstance(db.client, FakeDaxClient)
+    assert created == ["dax://cluster"]
+    assert db.local_cache is False
+
+
+def test_dax_delete_goes_through_dax_client(monkeypatch):
+    deleted = []
+
+    class FakeDaxClient:
+        def __init__(self, session, endpoint_url):
+            pass
+
+        def delete_item(self, **kwargs):
+            deleted.append(kwargs)
+            return {}
+
+    monkeypatch.setattr("database.AmazonDaxClient", FakeDaxClient)
+    monkeypatch.setattr("database._shared_dax_clients", {})
+
+    db = MentionDatabase(table_name=TABLE_NAME, dax_endpoint="dax://cluster")
+    assert db.delete_mention("dax_id", 1700000000) == True
+    assert deleted == [
+        {
+            "TableName": TABLE_NAME,
+            "Key": {
+                "mention_id": {"S": "dax_id"},
+                "timestamp": {"N": "1700000000"},
+            },
+        }
+    ]
+
+
+def test_buffered_store_mention(dynamodb_table, monkeypatch):
+    db = MentionDatabase(table_name=TABLE_NAME, buffer_writes=True)
+    requests = []
+    real_batch_write_item = db.client.batch_write_item
+
+    def counting_batch_write_item(RequestItems):
+        requests.append(RequestItems)
+        return real_batch_write_item(RequestItems=RequestItems)
+
+    monkeypatch.setattr(db.client, "batch_write_item", counting_batch_write_item)
+
+    timestamp = _NOW
+    prefix = _unique("buffered_id")
+    for i in range(30):
+        assert db.store_mention(
+            {
+                "mention_id": f"{prefix}_{i}",
+                "timestamp": timestamp,
+                "source": "reddit",
+                "content": f"Buffered content {i}",
+            }
+        )
+    db.close()
+
+    # 30 puts are coalesced into at most a couple of batch requests
+    assert sum(len(r[TABLE_NAME]) for r in requests) == 30
+    assert len(requests) <= 3
+    assert db.get_mention(f"{prefix}_29", timestamp) is not None
+
+
 def test_batch_store_mentions(dynamodb_table):
     # Create test mentions
+    prefix = _unique("batch_id")
     mentions = [
         {
-            "mention_id": f"batch_id_{i}",
-            "timestamp": int(datetime.now().timestamp()),
+            "mention_id": f"{prefix}_{i}",
+            "timestamp": _NOW,
             "source": "twitter",
             "content": f"Test content {i}",
             "url": f"https://twitter.com/test/{i}",
@@ -60,12 +304,93 @@ def test_batch_store_mentions(dynamodb_table):
     assert len(failed) == 0
 
 
+def test_batch_store_mentions_with_missing_values(dynamodb_table):
+    prefix = _unique("none_id")
+    mentions = [
+        {
+            "mention_id": f"{prefix}_{i}",
+            "timestamp": _NOW,
+            "source": "twitter",
+            "content": f"Test content {i}",
+            "author": None if i == 0 else f"user_{i}",
+            "sentiment": None if i == 1 else 0.5,
+        }
+        for i in range(5)
+    ]
+    mentions.append({**mentions[2], "mention_id": f"{prefix}_bad", "sentiment": []})
+
+    # Only the mention with an unusable sentiment fails, not its whole chunk
+    successful, failed = dynamodb_table.batch_store_mentions(mentions)
+    assert [m["mention_id"] for m in successful] == [
+        m["mention_id"] for m in mentions[:5]
+    ]
+    assert [m["mention_id"] for m in failed] == [f"{prefix}_bad"]
+
+
+def test_batch_store_mentions_retries_unprocessed(dynamodb_table, monkeypatch):
+    prefix = _unique("retry_id")
+    mentions = [
+        {
+            "mention_id": f"{prefix}_{i}",
+            "timestamp": _NOW,
+            "source": "twitter",
+            "content": f"Test content {i}",
+        }
+        for i in range(3)
+    ]
+
+    # Throttle the last item of the first request, then let writes through
+    real_batch_write_item = dynamodb_table.client.batch_write_item
+    requests = []
+
+    def throttling_batch_write_item(RequestItems):
+        requests.append(RequestItems)
+        if len(requests) > 1:
+            return real_batch_write_item(RequestItems=RequestItems)
+        *written, throttled = RequestItems[TABLE_NAME]
+        real_batch_write_item(RequestItems={TABLE_NAME: written})
+        return {"UnprocessedItems": {TABLE_NAME: [throttled]}}
+
+    monkeypatch.setattr(
+        dynamodb_table.client, "batch_write_item", throttling_batch_write_item
+    )
+    monkeypatch.setattr("database.time.sleep", lambda seconds: None)
+
+    successful, failed = dynamodb_table.batch_store_mentions(mentions)
+    assert len(successful) == 3
+    assert len(failed) == 0
+    assert len(requests) == 2
+    assert len(requests[1][TABLE_NAME]) == 1
+
+
+def test_batch_store_mentions_dedupes_keys(dynamodb_table):
+    timestamp = _NOW
+    prefix = _unique("dup_id")
+    mentions = [
+        {
+            "mention_id": f"{prefix}_{i % 2}",
+            "timestamp": timestamp,
+            "source": "twitter",
+            "content": f"Test content {i}",
+        }
+        for i in range(4)
+    ]
+
+    successful, failed = dynamodb_table.batch_store_mentions(mentions)
+    assert [m["content"] for m in successful] == ["Test content 2", "Test content 3"]
+    assert len(failed) == 0
+
+    stored = dynamodb_table.get_mention(f"{prefix}_0", timestamp)
+    assert stored["content"] == "Test content 2"
+
+
 def test_query_mentions_by_source(dynamodb_table):
     # Store some test mentions with different sources
-    current_time = int(datetime.now().timestamp())
+    current_time = _NOW
+    prefix = _unique("query_id")
     mentions = [
         {
-            "mention_id": f"query_id_{i}",
+            "mention_id": f"{prefix}_{i}",
             "timestamp": current_time,
             "source": "reddit" if i % 2 == 0 else "twitter",
             "content": f"Test content {i}",
@@ -77,19 +402,110 @@ def test_query_mentions_by_source(dynamodb_table):
     ]
 
     # Store all mentions
-    for mention in mentions:
-        dynamodb_table.store_mention(mention)
+    successful, failed = dynamodb_table.batch_store_mentions(mentions)
+    assert not failed
 
     # Query reddit mentions
     reddit_mentions = dynamodb_table.query_mentions_by_source("reddit")
     assert len(reddit_mentions) == 5  # Should get 5 reddit mentions
+    assert all(type(m["timestamp"]) is int for m in reddit_mentions)
+
+    projected = dynamodb_table.query_mentions_by_source(
+        "reddit", projection=["mention_id", "timestamp", "url"]
+    )
+    assert len(projected) == 5
+    assert all(set(m) == {"mention_id", "timestamp", "url"} for m in projected)
+
+
+def test_query_mentions_by_source_paginates_time_range(dynamodb_table, monkeypatch):
+    # Spread mentions over a week so the range is split into parallel queries
+    start_time = _NOW - 7 * 86400
+    prefix = _unique("range_id")
+    mentions = [
+        {
+            "mention_id": f"{prefix}_{i}",
+            "timestamp": start_time + i * 3600,
+            "source": "reddit",
+            "content": f"Test content {i}",
+        }
+        for i in range(7 * 24)
+    ]
+    # moto pages index queries in insertion order rather than sort key
+    # order, so write the chunks in timestamp order on one thread
+    monkeypatch.setattr(dynamodb_table, "parallelism", 1)
+    dynamodb_table.batch_store_mentions(mentions)
+    end_time = start_time + 7 * 86400
+
+    results = dynamodb_table.query_mentions_by_source(
+        "reddit", start_time, end_time, limit=1000
+    )
+    assert [m["mention_id"] for m in results] == [m["mention_id"] for m in mentions]
+
+    # Count the items each sub-range query reads
+    read = []
+    real_query = dynamodb_table.client.query
+
+    def counting_query(**kwargs):
+        response = real_query(**kwargs)
+        read.append(len(response["Items"]))
+        return response
+
+    monkeypatch.setattr(dynamodb_table.client, "query", counting_query)
+
+    limited = dynamodb_table.query_mentions_by_source(
+        "reddit", start_time, end_time, limit=30
+    )
+    assert [m["mention_id"] for m in limited] == [
+        m["mention_id"] for m in mentions[:30]
+    ]
+    assert sum(read) <= 2 * 30
+
+
+def test_query_mentions_by_source_async_follows_pages(dynamodb_table):
+    prefix = _unique("async_page_id")
+    mentions = [
+        {
+            "mention_id": f"{prefix}_{i}",
+            "timestamp": _NOW + i,
+            "source": "reddit",
+            "content": f"Test content {i}",
+        }
+        for i in range(10)
+    ]
+    dynamodb_table.batch_store_mentions(mentions)
+
+    # Cut every page at 3 items, as DynamoDB does at 1 MB
+    pages = []
+
+    class AsyncClient:
+        async def query(self, **kwargs):
+            response = dynamodb_table.client.query(
+                **{**kwargs, "Limit": min(kwargs["Limit"], 3)}
+            )
+            pages.append(len(response["Items"]))
+            return response
+
+    dynamodb_table._async_client = AsyncClient()
+    try:
+        results = asyncio.run(dynamodb_table.query_mentions_by_source_async("reddit"))
+        limited = asyncio.run(
+            dynamodb_table.query_mentions_by_source_async("reddit", limit=5)
+        )
+    finally:
+        dynamodb_table._async_client = None
+
+    assert [m["mention_id"] for m in results] == [m["mention_id"] for m in mentions]
+    assert [m["mention_id"] for m in limited] == [
+        m["mention_id"] for m in mentions[:5]
+    ]
+    assert pages == [3, 3, 3, 1, 3, 2]
 
 
 def test_delete_mention(dynamodb_table):
     # Store a mention
     mention = {
-        "mention_id": "delete_test_id",
-        "timestamp": int(datetime.now().timestamp()),
+        "mention_id": _unique("delete_test_id"),
+        "timestamp": _NOW,
         "source": "reddit",
         "content": "Content to delete",
         "url": "https://reddit.com/delete_test",